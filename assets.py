@@ -0,0 +1,113 @@
+"""Локальні зображення схем: рендер не ходить на GitHub.
+
+Файли лежать у static/ поруч зі скриптами. Streamlit віддає їх сам
+(server.enableStaticServing у .streamlit/config.toml) за адресою
+app/static/<файл>?v=<хеш вмісту>: поки файл той самий, адреса та сама й
+браузер бере його з кешу; після заміни файлу змінюється хеш і адреса.
+
+Рендер ніколи не звертається до інтернету: поки файлу немає в static/,
+сторінка показує попередження з командою нижче. Наповнити static/ на
+машині з інтернетом (і закомітити файли для закритої мережі):
+
+    python -m assets            # завантажити відсутні схеми
+    python -m assets --force    # перезавантажити всі
+"""
+import argparse
+import functools
+import hashlib
+import os
+import urllib.request
+
+import streamlit as st
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_URL = "app/static"
+
+SCHEMATIC = "schematic.png"
+GSM_SCHEMATIC = "gsm_schematic.png"
+
+# Звідки схеми брались раніше: лише для python -m assets, не для рендеру
+SOURCES = {
+    SCHEMATIC: "https://raw.githubusercontent.com/m3t4lray/gpt-assets/main/schematic.png",
+    GSM_SCHEMATIC: "https://raw.githubusercontent.com/m3t4lray/gpt-assets/main/gsm_schematic.png",
+}
+
+
+def path(name):
+    return os.path.join(STATIC_DIR, name)
+
+
+def _stat(name):
+    try:
+        stat = os.stat(path(name))
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=32)
+def _digest(name, mtime, size):
+    # Файл хешується один раз на версію; mtime і розмір у ключі — перерахувати після заміни
+    with open(path(name), "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()[:16]
+
+
+def _missing(name):
+    st.warning(f"Схеми {name} немає в {STATIC_DIR}. Завантажте її на машині з інтернетом: python -m assets {name}")
+
+
+def url(name):
+    """Адреса файлу зі static/ з хешем вмісту; без локального файлу — попередження на сторінці."""
+    stat = _stat(name)
+    if stat is None:
+        _missing(name)
+        return f"{STATIC_URL}/{name}"
+    return f"{STATIC_URL}/{name}?v={_digest(name, *stat)}"
+
+
+def image(name, **kwargs):
+    """st.image з локального файлу; без нього — попередження замість зображення."""
+    if _stat(name) is None:
+        _missing(name)
+        return
+    st.image(path(name), **kwargs)
+
+
+def fetch(names=None, force=False, timeout=30):
+    """Завантажує схеми з SOURCES у static/; повертає список завантажених файлів."""
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    fetched = []
+    for name in names or SOURCES:
+        if not force and _stat(name) is not None:
+            continue
+        with urllib.request.urlopen(SOURCES[name], timeout=timeout) as response:
+            content = response.read()
+        # Через тимчасовий файл, щоб сервер не віддав напівзаписану схему
+        partial = path(name) + ".part"
+        with open(partial, "wb") as file:
+            file.write(content)
+        os.replace(partial, path(name))
+        fetched.append(name)
+    return fetched
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m assets", description="Завантаження схем у static/")
+    parser.add_argument("names", nargs="*", help=f"файли з {', '.join(SOURCES)} (типово — всі)")
+    parser.add_argument("--force", action="store_true", help="перезавантажити наявні файли")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.names) - set(SOURCES))
+    if unknown:
+        parser.error(f"невідомі файли: {', '.join(unknown)}")
+
+    try:
+        fetched = fetch(args.names, args.force)
+    except OSError as error:
+        parser.error(f"не вдалося завантажити: {error}")
+    for name in SOURCES:
+        state = "завантажено" if name in fetched else ("є" if _stat(name) else "відсутній")
+        print(f"{path(name)}: {state}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import numpy as np
+import pandas as pd
+
+# -------------------------------
+# Статуси блоків
+# -------------------------------
+STATUS_NORMAL = "Норма"
+STATUS_ICE    = "Ожеледь"
+STATUS_BREAK  = "Порив"
+STATUS_OFF    = "Вимкнено"
+
+# Порядок кортежу задає коди статусів у масиві BlockStore.status
+STATUSES = (STATUS_NORMAL, STATUS_ICE, STATUS_BREAK, STATUS_OFF)
+NORMAL, ICE, BREAK, OFF = range(len(STATUSES))
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+
+def classify(temperature, humidity, wind):
+    """Ті самі правила, що й у Block.update, але для цілих масивів."""
+    status = np.full(len(temperature), NORMAL, dtype=np.int8)
+    status[np.asarray(wind) > 25] = BREAK
+    # Ожеледь має пріоритет над поривом — тому записується останньою
+    status[(np.asarray(temperature) < -5) & (np.asarray(humidity) > 80)] = ICE
+    return status
+
+
+class BlockView:
+    """Легкий доступ до одного блока за іменем — замість окремого об'єкта Block."""
+
+    __slots__ = ("_store", "_i")
+
+    STATUS_NORMAL = STATUS_NORMAL
+    STATUS_ICE    = STATUS_ICE
+    STATUS_BREAK  = STATUS_BREAK
+    STATUS_OFF    = STATUS_OFF
+
+    def __init__(self, store, i):
+        self._store = store
+        self._i = i
+
+    @property
+    def name(self):
+        return self._store.names[self._i]
+
+    @property
+    def enabled(self):
+        return bool(self._store.enabled[self._i])
+
+    @enabled.setter
+    def enabled(self, value):
+        # Як у словникових варіантах: статус не чіпаємо
+        self._store.set_enabled(self._i, value)
+
+    @property
+    def status(self):
+        return STATUSES[self._store.status[self._i]]
+
+    @status.setter
+    def status(self, value):
+        self._store.set_status(self._i, value)
+
+    @property
+    def temperature(self):
+        return float(self._store.temperature[self._i])
+
+    @property
+    def humidity(self):
+        return float(self._store.humidity[self._i])
+
+    @property
+    def wind(self):
+        return float(self._store.wind[self._i])
+
+    def toggle(self, enabled):
+        self._store.toggle(self._i, enabled)
+
+    def update(self, temperature, humidity, wind):
+        self._store.update_at([self._i], [temperature], [humidity], [wind])
+
+
+class BlockStore:
+    """Стан усіх блоків у суцільних масивах NumPy (один рядок — один блок)."""
+
+    STATUS_NORMAL = STATUS_NORMAL
+    STATUS_ICE    = STATUS_ICE
+    STATUS_BREAK  = STATUS_BREAK
+    STATUS_OFF    = STATUS_OFF
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        if len(self.index) != len(self.names):
+            raise ValueError("Імена блоків мають бути унікальними")
+        n = len(self.names)
+        self.enabled = np.ones(n, dtype=bool)
+        self.temperature = np.zeros(n, dtype=np.float64)
+        self.humidity = np.zeros(n, dtype=np.float64)
+        self.wind = np.zeros(n, dtype=np.float64)
+        self.status = np.full(n, NORMAL, dtype=np.int8)
+        # Лічильник змін: похідні таблиці перебудовуються лише коли він зростає
+        self.version = 0
+
+    # -------------------------------
+    # Доступ за іменем (як до словника блоків)
+    # -------------------------------
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __getitem__(self, name):
+        return BlockView(self, self.index[name])
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def keys(self):
+        return list(self.names)
+
+    def values(self):
+        return (BlockView(self, i) for i in range(len(self.names)))
+
+    def items(self):
+        return ((name, BlockView(self, i)) for i, name in enumerate(self.names))
+
+    # -------------------------------
+    # Зміна стану
+    # -------------------------------
+    def _position(self, key):
+        return self.index[key] if isinstance(key, str) else key
+
+    def toggle(self, key, enabled):
+        i = self._position(key)
+        if self.enabled[i] == enabled and (enabled or self.status[i] == OFF):
+            return
+        self.enabled[i] = enabled
+        if not enabled:
+            self.status[i] = OFF
+        self.version += 1
+
+    def toggle_all(self, enabled):
+        self.enabled[:] = enabled
+        if not enabled:
+            self.status[:] = OFF
+        self.version += 1
+
+    def set_enabled(self, key, enabled):
+        """Змінює лише прапорець enabled, без статусу (як у словникових варіантах)."""
+        i = self._position(key)
+        if self.enabled[i] != enabled:
+            self.enabled[i] = enabled
+            self.version += 1
+
+    def set_status(self, key, status):
+        """Примусово задає статус блоку, індексам або масці."""
+        if isinstance(key, str):
+            key = self.index[key]
+        self.status[key] = STATUS_CODES[status] if isinstance(status, str) else status
+        self.version += 1
+
+    def enabled_indices(self):
+        return np.flatnonzero(self.enabled)
+
+    def update(self, temperature, humidity, wind):
+        """Аналог Block.update для всіх блоків: масиви довжиною len(store)."""
+        self.update_at(np.arange(len(self.names)), temperature, humidity, wind)
+
+    def update_at(self, idx, temperature, humidity, wind):
+        """Оновлює блоки з індексами idx; вимкнені блоки ігноруються."""
+        idx = np.asarray(idx, dtype=np.intp)
+        temperature = np.asarray(temperature, dtype=np.float64)
+        humidity = np.asarray(humidity, dtype=np.float64)
+        wind = np.asarray(wind, dtype=np.float64)
+        active = self.enabled[idx]
+        if not active.all():
+            idx = idx[active]
+            temperature = temperature[active]
+            humidity = humidity[active]
+            wind = wind[active]
+        self.temperature[idx] = temperature
+        self.humidity[idx] = humidity
+        self.wind[idx] = wind
+        self.status[idx] = classify(temperature, humidity, wind)
+        self.version += 1
+
+    # -------------------------------
+    # Таблиці для графіків і журналу
+    # -------------------------------
+    def status_labels(self, idx=None):
+        codes = self.status if idx is None else self.status[idx]
+        return pd.Categorical.from_codes(codes, categories=STATUSES)
+
+    def status_counts(self):
+        counts = np.bincount(self.status, minlength=len(STATUSES))
+        return pd.Series(counts, index=pd.Index(STATUSES, name="Статус"), name="Кількість")
+
+    def to_frame(self, mask=None):
+        """Таблиця Блок/Температура/Вологість/Вітер/Статус для рядків mask."""
+        idx = np.arange(len(self.names)) if mask is None else np.flatnonzero(mask)
+        return pd.DataFrame({
+            "Блок": pd.Categorical.from_codes(idx, categories=self.names),
+            "Температура": self.temperature[idx],
+            "Вологість": self.humidity[idx],
+            "Вітер": self.wind[idx],
+            "Статус": self.status_labels(idx),
+        })
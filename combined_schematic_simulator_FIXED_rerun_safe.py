@@ -3,6 +3,8 @@ import streamlit as st
 import random
 from datetime import datetime
 
+import assets
+
 st.set_page_config(layout="wide")
 
 class Block:
@@ -87,10 +89,10 @@ st.markdown("""
 
 indicators_html = '''
 <div class="overlay-container">
-    <img src="https://raw.githubusercontent.com/m3t4lray/gpt-assets/main/schematic.png" class="network-image">
+    <img src="{}" class="network-image">
     {}
 </div>
-'''.format("\n".join(
+'''.format(assets.url(assets.SCHEMATIC), "\n".join(
     f'<div class="indicator BB{i}">{("🟢" if blk.status=="Норма" else "🔴")}</div>'
     for i, blk in enumerate(st.session_state.blocks.values(), start=1)
 ))
@@ -1,11 +1,15 @@
-import time
-
 import streamlit as st
 import random
 from datetime import datetime
 import pandas as pd
 import altair as alt
 
+import assets
+from derived_frames import DerivedFrames
+from event_log import EventLog
+from log_export import export_csv
+from scenario_player import ScenarioPlayer, play
+
 st.set_page_config(layout="wide")
 
 # -------------------------------
@@ -35,7 +39,11 @@ class Block:
 # -------------------------------
 if "blocks" not in st.session_state:
     st.session_state.blocks = {f"BB{i}": Block(f"BB{i}") for i in range(1, 8)}
-    st.session_state.events = []
+    st.session_state.events = EventLog(st.session_state.blocks)
+    st.session_state.derived = DerivedFrames()
+if "stage_player" not in st.session_state:
+    st.session_state.stage_player = ScenarioPlayer(interval=0.8)
+    st.session_state.progress_player = ScenarioPlayer(interval=1.0)
 
 # -------------------------------
 # Ліва панель керування
@@ -59,17 +67,10 @@ with col1:
             blk.humidity = round(random.uniform(50, 100), 1)
             blk.wind = round(random.uniform(0, 40), 1)
             blk.update_status()
-            st.session_state.events.append({
-                "Час": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "Блок": blk.name,
-                "Статус": blk.status,
-                "Температура": blk.temperature,
-                "Вологість": blk.humidity,
-                "Вітер": blk.wind
-            })
+        st.session_state.events.append_blocks(st.session_state.blocks.values())
 
 with col2:
-    st.image("https://raw.githubusercontent.com/m3t4lray/gpt-assets/main/gsm_schematic.png", use_container_width=True)
+    assets.image(assets.GSM_SCHEMATIC, use_container_width=True)
 
 # -------------------------------
 # Таблиця параметрів
@@ -129,10 +130,13 @@ if st.button("▶️ Симулювати подію"):
 # Завантаження CSV журналу
 # -------------------------------
 st.markdown("### 🗂 Журнал подій")
-df_log = pd.DataFrame(st.session_state.events)
-if not df_log.empty:
-    st.dataframe(df_log, use_container_width=True)
-    st.download_button("⬇️ Завантажити CSV", df_log.to_csv(index=False).encode("utf-8"), file_name="events.csv")
+events = st.session_state.events
+if len(events):
+    st.caption(f"Показано {len(events)} найновіших з {events.total} подій")
+    st.dataframe(events.to_frame(), use_container_width=True)
+    # CSV будується лише після нових записів у журнал, а не на кожен rerun
+    csv = st.session_state.derived.get("csv", (events.version,), lambda: export_csv(events.to_frame()))
+    st.download_button("⬇️ Завантажити CSV", csv, file_name="events.csv")
 else:
     st.info("Подій ще не зафіксовано.")
 
@@ -164,10 +168,8 @@ if not df_graphs.empty:
 # 🔁 Поетапна симуляція подій
 # -------------------------------
 if st.button("▶️ Запустити симуляцію події з етапами"):
-    for i, step in enumerate(event_options[selected_event], 1):
-        st.write(f"**Крок {i}:** {step}")
-        time.sleep(0.8)
-    st.success("✅ Подію завершено")
+    st.session_state.stage_player.start(event_options[selected_event])
+play(st.session_state.stage_player, done_message="✅ Подію завершено")
 
 
 # -------------------------------
@@ -198,13 +200,8 @@ if not df_graphs.empty:
 # 🔁 Анімована симуляція подій
 # -------------------------------
 if st.button("▶️ Анімувати подію з прогресом"):
-    steps = event_options[selected_event]
-    progress = st.progress(0)
-    for i, step in enumerate(steps):
-        st.write(f"**Крок {i+1}/{len(steps)}:** {step}")
-        progress.progress((i + 1) / len(steps))
-        time.sleep(1)
-    st.success("✅ Симуляцію завершено")
+    st.session_state.progress_player.start(event_options[selected_event])
+play(st.session_state.progress_player, show_progress=True)
 
 
 # -------------------------------
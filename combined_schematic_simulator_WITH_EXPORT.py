@@ -1,106 +1,157 @@
-import altair as alt
+import numpy as np
 import pandas as pd
 
 import streamlit as st
-import random
+import uuid
 from datetime import datetime
 
+from block_store import NORMAL, OFF, STATUSES
+from derived_frames import DerivedFrames
+from downsample import DOWNSAMPLERS
+from event_writer import EventWriter
+from graph_component import schematic_overlay
+from graph_layout import compute_layout
+from history import METRICS, TelemetryHistory, budget_from_env, capacity_for
+from log_export import FORMATS, available_formats, export_csv
+import schematic_svg
+from telemetry import TelemetryGenerator, seed_from_env
+import telemetry_chart
+import topology
+
 st.set_page_config(layout="wide")
 
-class Block:
-    STATUS_NORMAL = "Норма"
-    STATUS_ICE    = "Ожеледь"
-    STATUS_BREAK  = "Порив"
-    STATUS_OFF    = "Вимкнено"
-
-    def __init__(self, name):
-        self.name = name
-        self.enabled = True
-        self.status = self.STATUS_NORMAL
-        self.temperature = 0
-        self.humidity = 0
-        self.wind = 0
-
-    def toggle(self, enabled):
-        self.enabled = enabled
-        if not enabled:
-            self.status = self.STATUS_OFF
-
-    def update(self, temperature, humidity, wind):
-        if not self.enabled:
-            return
-        self.temperature = temperature
-        self.humidity = humidity
-        self.wind = wind
-        if temperature < -5 and humidity > 80:
-            self.status = self.STATUS_ICE
-        elif wind > 25:
-            self.status = self.STATUS_BREAK
-        else:
-            self.status = self.STATUS_NORMAL
+# Більше перемикачів і панелей деталей сторінка не витягне
+MAX_BLOCK_WIDGETS = 50
+
+
+@st.cache_data(max_entries=8)
+def get_schematic(key, _network):
+    # SVG-схема рахується один раз на топологію; ключ кешу — її хеш
+    layout = _network.layout() or compute_layout(_network.edge_names(), _network.ids)
+    return schematic_svg.render(_network, layout)
+
+
+@st.cache_data
+def get_telemetry_spec(width, palette):
+    # Специфікація графіків будується раз на ширину й палітру; на rerun змінюються лише дані
+    return telemetry_chart.spec(width, palette)
 
-if "blocks" not in st.session_state:
-    st.session_state.blocks = {f"BB{i}": Block(f"BB{i}") for i in range(1, 8)}
-if "updated" not in st.session_state:
-    st.session_state.updated = False
 
 st.sidebar.title("⚙️ Керування блоками")
-for name, blk in st.session_state.blocks.items():
+network = topology.select("schematic.json")
+
+if st.session_state.get("topology_key") != network.key:
+    # Нова топологія — новий стан блоків, історія і похідні таблиці сесії
+    st.session_state.topology_key = network.key
+    st.session_state.blocks = network.block_store()
+    # Глибина — за бюджетом пам'яті (SIMULATOR_HISTORY_MB) і кількістю блоків; масиви — з першим тіком
+    n_blocks = len(st.session_state.blocks)
+    st.session_state.history = TelemetryHistory(n_blocks, capacity_for(n_blocks, budget_from_env()))
+    st.session_state.derived = DerivedFrames()
+if "updated" not in st.session_state:
+    st.session_state.updated = False
+if "telemetry" not in st.session_state:
+    st.session_state.telemetry = TelemetryGenerator(seed_from_env())
+if "tick" not in st.session_state:
+    st.session_state.tick = 0
+    st.session_state.session_id = uuid.uuid4().hex
+blocks = st.session_state.blocks
+derived = st.session_state.derived
+history = st.session_state.history
+telemetry = st.session_state.telemetry
+
+for name, blk in list(blocks.items())[:MAX_BLOCK_WIDGETS]:
     state = st.sidebar.toggle(f"{name}: {'🟢' if blk.enabled else '🔴'}", value=blk.enabled)
     blk.toggle(state)
+if len(blocks) > MAX_BLOCK_WIDGETS:
+    st.sidebar.caption(f"…і ще {len(blocks) - MAX_BLOCK_WIDGETS} блоків")
+
+seed = st.sidebar.number_input("🎲 Seed телеметрії", min_value=0, value=telemetry.seed, step=1)
+if seed != telemetry.seed:
+    telemetry.reseed(seed)
+
+# Не більше точок на ряд, ніж пікселів у ширину графіка
+chart_width = st.sidebar.number_input("📐 Ширина графіків, px", min_value=100, value=800, step=100)
+downsample_method = st.sidebar.selectbox("Проріджування рядів", list(DOWNSAMPLERS))
+
+live_mode = st.sidebar.toggle("⏱ Живий режим", value=False)
+live_interval = st.sidebar.select_slider("Період оновлення, с", options=[0.25, 0.5, 1.0, 2.0, 5.0], value=1.0)
+
+
+# -------------------------------
+# 🗂 Логування подій у CSV / Parquet
+# -------------------------------
+@st.cache_resource
+def get_event_writer(path):
+    # Один фоновий записувач на файл для всіх сесій
+    return EventWriter(path)
+
 
-col1, col2 = st.columns([4, 1])
-with col1:
-    st.markdown("### 🖥️ Симуляція мережі")
-    if st.button("🔁 Оновити стан"):
-        for blk in st.session_state.blocks.values():
-            t = round(random.uniform(-15, 10), 1)
-            h = round(random.uniform(50, 100), 1)
-            w = round(random.uniform(0, 40), 1)
-            blk.update(t, h, w)
-        st.session_state.updated = True
-with col2:
-    st.markdown(f"<p style='text-align:right;'>Поточний час:<br><b>{datetime.now().strftime('%H:%M:%S')}</b></p>", unsafe_allow_html=True)
-
-st.markdown("""
-<style>
-    .overlay-container {
-        position: relative;
-        width: 100%;
-        max-width: 960px;
-        margin: auto;
-    }
-    .network-image {
-        width: 100%;
-    }
-    .indicator {
-        position: absolute;
-        font-size: 20px;
-    }
-    .BB1 { top: 100px; left: 200px; }
-    .BB2 { top: 100px; left: 370px; }
-    .BB3 { top: 100px; left: 490px; }
-    .BB4 { top: 270px; left: 200px; }
-    .BB5 { top: 270px; left: 310px; }
-    .BB6 { top: 180px; left: 280px; }
-    .BB7 { top: 180px; left: 570px; }
-</style>
-""", unsafe_allow_html=True)
-
-indicators_html = '''
-<div class="overlay-container">
-    <img src="https://raw.githubusercontent.com/m3t4lray/gpt-assets/main/schematic.png" class="network-image">
-    {}
-</div>
-'''.format("\n".join(
-    f'<div class="indicator BB{i}">{("🟢" if blk.status=="Норма" else "🔴")}</div>'
-    for i, blk in enumerate(st.session_state.blocks.values(), start=1)
-))
-
-st.components.v1.html(indicators_html, height=560)
+def build_entries():
+    entries = blocks.to_frame(blocks.status != OFF)
+    entries.insert(0, "Час", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    return entries[["Час", "Блок", "Статус", "Температура", "Вологість", "Вітер"]]
+
+
+event_file = st.sidebar.selectbox("💾 Файл журналу", ["events.csv", "events.parquet"])
+
+
+def record_tick():
+    """Один замір: телеметрія → історія → фоновий запис журналу."""
+    updated = telemetry.update_store(blocks)
+    history.append_store(blocks, updated, datetime.now())
+    st.session_state.tick += 1
+    st.session_state.updated = True
+    # Пишемо лише нові заміри: rerun без нового заміру має той самий tick
+    entries = derived.get("df_log", (blocks.version,), build_entries)
+    get_event_writer(event_file).submit(st.session_state.tick, entries, source=st.session_state.session_id)
+
+
+# -------------------------------
+# ⏱ Панель телеметрії (фрагмент)
+# -------------------------------
+# У живому режимі за таймером перезапускається лише ця функція,
+# решта сторінки (схема, графіки, журнал) не перебудовується.
+@st.fragment(run_every=live_interval if live_mode else None)
+def telemetry_panel():
+    if live_mode:
+        record_tick()
+    tcol1, tcol2 = st.columns([4, 1])
+    with tcol2:
+        st.markdown(f"<p style='text-align:right;'>Поточний час:<br><b>{datetime.now().strftime('%H:%M:%S')}</b></p>", unsafe_allow_html=True)
+    with tcol1:
+        counts = derived.get("status_counts", (blocks.version,), blocks.status_counts)
+        for column, (status, count) in zip(st.columns(len(counts)), counts.items()):
+            column.metric(status, int(count))
+    alerts = derived.get("alerts", (blocks.version,), lambda: blocks.to_frame(
+        (blocks.status != OFF) & (blocks.status != NORMAL)
+    ).head(50))
+    if not alerts.empty:
+        st.dataframe(alerts, use_container_width=True, hide_index=True)
+
+
+st.markdown("### 🖥️ Симуляція мережі")
+if st.button("🔁 Оновити стан", disabled=live_mode):
+    record_tick()
+telemetry_panel()
+
+status_colors = {
+    "Норма": "green",
+    "Ожеледь": "skyblue",
+    "Порив": "orange",
+    "Вимкнено": "gray"
+}
+# Схема будується раз на топологію; далі фронтенд отримує лише блоки зі зміненим статусом
+schematic_overlay(
+    network.key,
+    network.block_ids,
+    lambda: get_schematic(network.key, network),
+    np.asarray(STATUSES)[np.where(blocks.enabled, blocks.status, OFF)],
+    status_colors,
+)
 
 st.markdown("### 📋 Деталі блоків")
-for blk in st.session_state.blocks.values():
+for blk in list(st.session_state.blocks.values())[:MAX_BLOCK_WIDGETS]:
     with st.expander(f"{blk.name} — Статус: {blk.status}"):
         if blk.status != blk.STATUS_OFF:
             st.write(f"🌡 Температура: {blk.temperature} °C")
@@ -115,108 +166,72 @@ for blk in st.session_state.blocks.values():
 # -------------------------------
 st.markdown("## 📈 Показники ТП за останній замір")
 
-data = {
-    "Блок": [],
-    "Температура": [],
-    "Вологість": [],
-    "Вітер": []
-}
-for blk in st.session_state.blocks.values():
-    if blk.status != blk.STATUS_OFF:
-        data["Блок"].append(blk.name)
-        data["Температура"].append(blk.temperature)
-        data["Вологість"].append(blk.humidity)
-        data["Вітер"].append(blk.wind)
-
-df_chart = pd.DataFrame(data)
-
-if not df_chart.empty:
-    st.line_chart(df_chart.set_index("Блок")[["Температура"]])
-    st.line_chart(df_chart.set_index("Блок")[["Вологість"]])
-    st.line_chart(df_chart.set_index("Блок")[["Вітер"]])
-else:
-    st.info("Немає активних блоків для побудови графіків.")
+# Проріджені рядки й підсумки статусів; перебудовуються лише після зміни blocks.version
+chart_data = derived.get(
+    ("chart_data", chart_width), (blocks.version,),
+    lambda: telemetry_chart.dataset(blocks, chart_width),
+)
 
-
-import csv
-import os
+if not (blocks.status != OFF).any():
+    st.info("Немає активних блоків для побудови графіків.")
+# Специфікація з кешу не змінюється між rerun — браузер лише підміняє набір даних
+st.vega_lite_chart(spec={
+    **get_telemetry_spec(chart_width, status_colors),
+    "datasets": chart_data,
+})
 
 # -------------------------------
-# 🗂 Логування подій у CSV
+# 📉 Історія показників по блоках
 # -------------------------------
-event_file = "events.csv"
-new_entries = []
-
-for blk in st.session_state.blocks.values():
-    if blk.status != blk.STATUS_OFF:
-        new_entries.append({
-            "Час": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "Блок": blk.name,
-            "Статус": blk.status,
-            "Температура": blk.temperature,
-            "Вологість": blk.humidity,
-            "Вітер": blk.wind
-        })
-
-if new_entries:
-    file_exists = os.path.isfile(event_file)
-    with open(event_file, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=new_entries[0].keys())
-        if not file_exists:
-            writer.writeheader()
-        writer.writerows(new_entries)
+st.markdown("## 📉 Історія показників")
+
+if len(history):
+    hcol1, hcol2 = st.columns([3, 1])
+    history_blocks = hcol1.multiselect("Блоки", blocks.names, default=blocks.names[:5])
+    window_options = sorted({n for n in (10, 30, 60, 120) if n < history.capacity} | {history.capacity})
+    history_window = hcol2.select_slider("Останні заміри", options=window_options, value=window_options[-1])
+    block_idx = [blocks.index[name] for name in history_blocks]
+
+    def history_series(metric, i):
+        times, values = history.series(metric, [i], last=history_window)
+        x, y = DOWNSAMPLERS[downsample_method](times, values[0], chart_width)
+        return pd.DataFrame({"Час": x, metric: y, "Блок": blocks.names[i]})
+
+    if block_idx:
+        for metric in METRICS:
+            # Кеш на кожен ряд: (метрика, блок, вікно, ширина, метод) + версія історії
+            parts = [
+                derived.get(
+                    ("history", metric, i, history_window, chart_width, downsample_method),
+                    (history.version,),
+                    lambda: history_series(metric, i),
+                )
+                for i in block_idx
+            ]
+            st.markdown(f"**{metric}**")
+            st.line_chart(pd.concat(parts, ignore_index=True), x="Час", y=metric, color="Блок")
+else:
+    st.info("Історія з'явиться після першого оновлення стану.")
 
-# -------------------------------
-# 📈 Додаткові графіки
-# -------------------------------
-st.markdown("## 📊 Діаграми")
-
-# Стан кожного блока — bar chart
-status_counts = {}
-for blk in st.session_state.blocks.values():
-    status_counts[blk.status] = status_counts.get(blk.status, 0) + 1
-
-st.bar_chart(pd.DataFrame.from_dict(status_counts, orient="index", columns=["Кількість"]))
-
-# Темп vs Вологість (scatter)
-scatter_data = pd.DataFrame([
-    {
-        "Температура": blk.temperature,
-        "Вологість": blk.humidity,
-        "Блок": blk.name
-    }
-    for blk in st.session_state.blocks.values()
-    if blk.status != blk.STATUS_OFF
-])
-
-if not scatter_data.empty:
-    st.markdown("### 🌡️ Діаграма розсіювання: Темп vs Вологість")
-    st.altair_chart(
-        alt.Chart(scatter_data).mark_circle(size=80).encode(
-            x="Температура",
-            y="Вологість",
-            color="Блок",
-            tooltip=["Блок", "Температура", "Вологість"]
-        ).interactive(),
-        use_container_width=True
-    )
 
+new_entries = derived.get("df_log", (blocks.version,), build_entries)
 
 # -------------------------------
 # 📁 Вивід журналу подій + export
 # -------------------------------
 st.markdown("## 🗂 Журнал подій")
 
-if new_entries:
-    df_log = pd.DataFrame(new_entries)
+if not new_entries.empty:
+    df_log = new_entries
     st.dataframe(df_log, use_container_width=True)
 
-    csv_data = df_log.to_csv(index=False).encode('utf-8')
+    # Файл будується лише після натискання кнопки, частинами і зі стисненням
+    compression, ext, mime = FORMATS[st.selectbox("Формат експорту", available_formats())]
     st.download_button(
         label="⬇️ Завантажити CSV журнал",
-        data=csv_data,
-        file_name="events.csv",
-        mime="text/csv"
+        data=lambda: export_csv(df_log, compression),
+        file_name=f"events{ext}",
+        mime=mime
     )
 else:
     st.info("Наразі немає нових подій для журналу.")
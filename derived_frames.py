@@ -0,0 +1,18 @@
+class DerivedFrames:
+    """Кеш похідних таблиць сесії, прив'язаний до лічильників версій входів.
+
+    get("df_chart", (blocks.version,), build) викликає build() лише тоді, коли
+    кортеж версій змінився з минулого разу; інакше повертає збережений результат.
+    На відміну від st.cache_data, нічого не серіалізується і не ділиться між сесіями.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def get(self, name, versions, build):
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        value = build()
+        self._cache[name] = (versions, value)
+        return value
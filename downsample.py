@@ -0,0 +1,102 @@
+import numpy as np
+
+# -------------------------------
+# Проріджування рядів перед відправкою у браузер
+# -------------------------------
+
+# Діаметр точки діаграми розсіювання в пікселях (mark_circle(size=80))
+POINT = 9
+
+
+def _as_float(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.view(np.int64)
+    return x.astype(np.float64)
+
+
+def minmax(x, y, n_out):
+    """Мін і макс у кожному з n_out // 2 кошиків, у порядку часу.
+
+    Зберігає всі піки — головне для поривів вітру й провалів температури.
+    Повністю векторизовано: ряд доповнюється NaN до рівних кошиків.
+    """
+    x, y = np.asarray(x), np.asarray(y, dtype=np.float64)
+    n = len(y)
+    n_buckets = max(n_out // 2, 1)
+    if n <= n_out:
+        return x, y
+    size = -(-n // n_buckets)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    buckets = padded.reshape(n_buckets, size)
+    empty = np.isnan(buckets).all(axis=1)
+    offsets = np.arange(n_buckets) * size
+    lo = offsets + np.argmin(np.where(np.isnan(buckets), np.inf, buckets), axis=1)
+    hi = offsets + np.argmax(np.where(np.isnan(buckets), -np.inf, buckets), axis=1)
+    idx = np.unique(np.concatenate([lo[~empty], hi[~empty]]))
+    return x[idx], y[idx]
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: n_out точок, що найкраще зберігають форму.
+
+    NaN (вимкнені блоки) відкидаються. Вибір у кошику залежить від попереднього,
+    тому цикл іде по кошиках, але всередині кошика все векторизовано.
+    """
+    x, y = np.asarray(x), np.asarray(y, dtype=np.float64)
+    keep = ~np.isnan(y)
+    x, y = x[keep], y[keep]
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
+    xf = _as_float(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(xf[:n - 1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:n - 1], edges[:-1]) / counts
+    # Для останнього кошика "наступна" точка — остання точка ряду
+    mean_x = np.append(mean_x[1:], xf[-1])
+    mean_y = np.append(mean_y[1:], y[-1])
+
+    out = np.empty(n_out, dtype=np.intp)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (xf[a] - mean_x[i]) * (y[lo:hi] - y[a])
+            - (xf[a] - xf[lo:hi]) * (mean_y[i] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return x[out], y[out]
+
+
+DOWNSAMPLERS = {
+    "LTTB": lttb,
+    "Мін/макс": minmax,
+}
+
+
+def pixel_thin(x, y, width, height, point=POINT):
+    """Індекси точок діаграми розсіювання, не більше width.
+
+    Сітка має клітинки розміром з точку (point пікселів), бо дрібніші
+    точки однаково перекривають одна одну; якщо зайнятих клітинок усе ще
+    більше за width, лишається рівномірна вибірка з них.
+    """
+    x, y = _as_float(x), np.asarray(y, dtype=np.float64)
+    if len(x) <= width:
+        return np.arange(len(x))
+    cols = max(1, int(width // point))
+    rows = max(1, int(height // point))
+    span_x = np.ptp(x) or 1.0
+    span_y = np.ptp(y) or 1.0
+    col = ((x - x.min()) / span_x * (cols - 1)).astype(np.int64)
+    row = ((y - y.min()) / span_y * (rows - 1)).astype(np.int64)
+    _, first = np.unique(row * cols + col, return_index=True)
+    first = np.sort(first)
+    if len(first) > width:
+        first = first[np.linspace(0, len(first) - 1, width).astype(np.int64)]
+    return first
@@ -1,45 +1,79 @@
 
+import json
+
 import streamlit as st
+from pyvis.edge import Edge
 from pyvis.network import Network
-import networkx as nx
+from pyvis.node import Node
 import pandas as pd
-import tempfile
-import os
+
+import topology
+from fault_index import SubtreeIndex
+from graph_layout import compute_layout
 
 st.set_page_config(layout="wide")
 st.title("🔌 Граф електромережі з симуляцією подій")
 
-# -------------------------------
-# Побудова графа
-# -------------------------------
-G = nx.Graph()
-
-nodes = {
-    "Диспетчер": {"group": "control"},
-    "GSM": {"group": "comm"},
-    "TP1": {"group": "tp"},
-    "TP2": {"group": "tp"},
-    "TP3": {"group": "tp"},
-    "TP4": {"group": "tp"},
-}
+DEFAULT_COLOR = "#dddddd"
+# Події, після яких усе нижче за вузлом знеструмлюється
+OUTAGE_EVENTS = ("Обрив", "Вимкнено")
+
+
+@st.cache_resource(max_entries=16)
+def get_fault_index(key, _graph, root):
+    # Індекс піддерев будується один раз на топологію (key — її хеш)
+    return SubtreeIndex(_graph, root)
+
+
+@st.cache_data(max_entries=16)
+def base_html(key, _network):
+    """HTML мережі без статусів — серіалізується один раз на топологію (key — її хеш)."""
+    layout = _network.layout() or compute_layout(_network.edge_names(), _network.ids)
+    # vis-network вбудовано в сторінку: граф малюється і без доступу до CDN
+    net = Network(height="600px", width="100%", directed=False, cdn_resources="in_line")
+    # Напряму, а не add_node/add_edge: ті шукають дублікати перебором усього графа — O(n²)
+    for node in _network.ids:
+        x, y = layout[node]
+        options = Node(node, "dot", node, color=DEFAULT_COLOR, x=x, y=y).options
+        net.nodes.append(options)
+        net.node_ids.append(node)
+        net.node_map[node] = options
+    seen = set()
+    for source, target in _network.edge_names():
+        pair = (source, target) if source <= target else (target, source)
+        if pair not in seen:
+            seen.add(pair)
+            net.edges.append(Edge(source, target).options)
+    net.toggle_physics(False)
+    # У пам'яті, без net.show(): жодного спільного graph.html між сесіями
+    return net.generate_html()
 
-edges = [
-    ("Диспетчер", "GSM"),
-    ("GSM", "TP1"),
-    ("GSM", "TP2"),
-    ("TP2", "TP3"),
-    ("TP2", "TP4"),
-]
 
-for node, data in nodes.items():
-    G.add_node(node, group=data["group"])
+@st.cache_data(max_entries=64)
+def status_patch(colors):
+    """Скрипт, що перефарбовує лише змінені вузли у вже побудованому DataSet vis.js."""
+    update = [{"id": node, "color": color} for node, color in colors]
+    return f"<script>nodes.update({json.dumps(update, ensure_ascii=False)});</script>"
 
-G.add_edges_from(edges)
+
+def graph_html(key, _network, colors):
+    # colors — кортеж (вузол, колір) лише для вузлів, відмінних від DEFAULT_COLOR;
+    # у кеші лише базовий HTML на топологію і короткі патчі, а не повні копії сторінки
+    return base_html(key, _network).replace("</body>", status_patch(colors) + "\n</body>", 1)
+
+
+# -------------------------------
+# Побудова графа
+# -------------------------------
+network = topology.select("electric.json")
+G = network.graph
+# Джерело живлення радіальної мережі — диспетчерський вузол (або перший у файлі)
+supply_root = network.roots[0] if network.roots else network.ids[0]
 
 # -------------------------------
 # Симуляція події
 # -------------------------------
-selected_node = st.selectbox("Оберіть вузол для симуляції події", list(nodes.keys()))
+selected_node = st.selectbox("Оберіть вузол для симуляції події", network.ids)
 event_type = st.selectbox("Тип події", ["Норма", "Ожеледь", "КЗ", "Обрив", "Вимкнено"])
 
 status_colors = {
@@ -47,25 +81,19 @@ status_colors = {
     "Ожеледь": "lightblue",
     "КЗ": "red",
     "Обрив": "orange",
-    "Вимкнено": "gray"
+    "Вимкнено": "gray",
+    "Знеструмлено": "#555555"
 }
 
+colors = ((selected_node, status_colors[event_type]),)
+if event_type in OUTAGE_EVENTS:
+    lost = get_fault_index(network.key, G, supply_root).downstream(selected_node)
+    colors += tuple((node, status_colors["Знеструмлено"]) for node in lost)
+    if len(lost):
+        st.warning(f"Без живлення через {selected_node} ({len(lost)}): {', '.join(lost[:50])}")
+
 # -------------------------------
 # Візуалізація графа через PyVis
 # -------------------------------
-net = Network(height="600px", width="100%", directed=False)
-for node in G.nodes():
-    color = status_colors[event_type] if node == selected_node else "#dddddd"
-    net.add_node(node, label=node, color=color)
-
-for edge in G.edges():
-    net.add_edge(edge[0], edge[1])
-
-tmp_dir = tempfile.gettempdir()
-path = os.path.join(tmp_dir, "graph.html")
-net.show(path)
-
-# Показуємо у Streamlit
-with open(path, "r", encoding="utf-8") as f:
-    html = f.read()
+html = graph_html(network.key, network, colors)
 st.components.v1.html(html, height=640, scrolling=True)
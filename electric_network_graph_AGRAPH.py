@@ -2,34 +2,39 @@
 import streamlit as st
 from streamlit_agraph import agraph, Node, Edge, Config
 
+import topology
+from graph_layout import cached_layout
+
 st.set_page_config(layout="wide")
 st.title("🔌 Інтерактивний граф електромережі")
 
+
 # -------------------------------
 # Визначення вузлів і ребер
 # -------------------------------
+network = topology.select("electric.json")
+layout = network.layout() or cached_layout(network.key, network.edge_names())
+
+kind_styles = {
+    topology.DISPATCHER: {"size": 25, "color": "lightgray"},
+    topology.GSM: {"size": 20, "color": "lightblue"},
+    topology.SUBSTATION: {"size": 20, "color": "khaki"},
+    topology.BLOCK: {"color": "green"},
+}
 nodes = [
-    Node(id="Диспетчер", label="Диспетчер", size=25, color="lightgray"),
-    Node(id="GSM", label="GSM", size=20, color="lightblue"),
-    Node(id="TP1", label="TP1", color="green"),
-    Node(id="TP2", label="TP2", color="green"),
-    Node(id="TP3", label="TP3", color="green"),
-    Node(id="TP4", label="TP4", color="green")
+    Node(id=node, label=node, **kind_styles[kind])
+    for node, kind in zip(network.ids, network.kind.tolist())
 ]
+for node in nodes:
+    node.x, node.y = layout[node.id]
 
-edges = [
-    Edge(source="Диспетчер", target="GSM"),
-    Edge(source="GSM", target="TP1"),
-    Edge(source="GSM", target="TP2"),
-    Edge(source="TP2", target="TP3"),
-    Edge(source="TP2", target="TP4")
-]
+edges = [Edge(source=source, target=target) for source, target in network.edge_names()]
 
 # -------------------------------
 # Симуляція події
 # -------------------------------
 event_type = st.selectbox("Оберіть подію", ["Норма", "Ожеледь", "КЗ", "Обрив", "Вимкнено"])
-target_node = st.selectbox("На який елемент застосувати подію?", ["TP1", "TP2", "TP3", "TP4"])
+target_node = st.selectbox("На який елемент застосувати подію?", network.block_ids)
 
 status_colors = {
     "Норма": "green",
@@ -50,7 +55,7 @@ for node in nodes:
 config = Config(width=800,
                 height=500,
                 directed=False,
-                physics=True,
+                physics=False,  # координати пораховані на сервері
                 hierarchical=False)
 
 agraph(nodes=nodes, edges=edges, config=config)
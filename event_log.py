@@ -0,0 +1,126 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from block_store import STATUS_CODES, STATUSES
+
+DEFAULT_CAPACITY = 100_000
+
+COLUMNS = ("Час", "Блок", "Статус", "Температура", "Вологість", "Вітер")
+
+
+class EventLog:
+    """Журнал подій фіксованого розміру: попередньо виділений колоночний кільцевий буфер.
+
+    Кожен рядок записується двічі — у позицію p та p + capacity. Тоді останні
+    size рядків завжди лежать суцільним шматком масиву, і таблицю журналу можна
+    віддати як view без копіювання та без склеювання двох половин кільця.
+    """
+
+    def __init__(self, block_names, capacity=DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("Розмір журналу має бути додатним")
+        self.block_names = list(block_names)
+        self.block_index = {name: i for i, name in enumerate(self.block_names)}
+        self.capacity = capacity
+        self.time = np.zeros(2 * capacity, dtype="datetime64[s]")
+        self.block = np.zeros(2 * capacity, dtype=np.int32)
+        self.status = np.zeros(2 * capacity, dtype=np.int8)
+        self.temperature = np.zeros(2 * capacity, dtype=np.float64)
+        self.humidity = np.zeros(2 * capacity, dtype=np.float64)
+        self.wind = np.zeros(2 * capacity, dtype=np.float64)
+        self.size = 0
+        self.total = 0
+        self.version = 0
+        self._head = 0
+
+    def __len__(self):
+        return self.size
+
+    def _columns(self):
+        return (self.time, self.block, self.status, self.temperature, self.humidity, self.wind)
+
+    # -------------------------------
+    # Запис
+    # -------------------------------
+    def append_batch(self, time, block, status, temperature, humidity, wind):
+        n = len(block)
+        if n == 0:
+            return
+        values = [np.asarray(v) for v in (time, block, status, temperature, humidity, wind)]
+        if n > self.capacity:
+            # Старіші рядки однаково були б витіснені — пишемо лише хвіст
+            values = [v if v.ndim == 0 else v[-self.capacity:] for v in values]
+            self.total += n - self.capacity
+            n = self.capacity
+        pos = (self._head + np.arange(n)) % self.capacity
+        for column, value in zip(self._columns(), values):
+            column[pos] = value
+            column[pos + self.capacity] = value
+        self._head = (self._head + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+        self.total += n
+        self.version += 1
+
+    def append_store(self, store, idx, time=None):
+        """Записує поточні показники блоків idx зі сховища BlockStore."""
+        time = np.datetime64(time or datetime.now(), "s")
+        self.append_batch(time, idx, store.status[idx], store.temperature[idx], store.humidity[idx], store.wind[idx])
+
+    def append_blocks(self, blocks, time=None):
+        """Записує показники об'єктів Block (варіанти без BlockStore) одним пакетом."""
+        blocks = list(blocks)
+        time = np.datetime64(time or datetime.now(), "s")
+        self.append_batch(
+            time,
+            [self.block_index[blk.name] for blk in blocks],
+            [STATUS_CODES[blk.status] for blk in blocks],
+            [blk.temperature for blk in blocks],
+            [blk.humidity for blk in blocks],
+            [blk.wind for blk in blocks],
+        )
+
+    def clear(self):
+        self.size = 0
+        self._head = 0
+        self.version += 1
+
+    def resize(self, capacity):
+        """Змінює розмір зберігання, залишаючи найновіші рядки."""
+        if capacity == self.capacity:
+            return
+        window = [column[self._window()].copy() for column in self._columns()]
+        total, version = self.total, self.version
+        self.__init__(self.block_names, capacity)
+        self.append_batch(*window)
+        self.total = total
+        self.version = version + 1
+
+    # -------------------------------
+    # Читання без копіювання
+    # -------------------------------
+    def _window(self, last=None):
+        size = self.size if last is None else min(last, self.size)
+        stop = (self._head - 1) % self.capacity + 1 if self.size else 0
+        if stop < size:
+            stop += self.capacity
+        return slice(stop - size, stop)
+
+    def columns(self, last=None):
+        window = self._window(last)
+        return dict(zip(COLUMNS, (column[window] for column in self._columns())))
+
+    def to_frame(self, last=None):
+        columns = self.columns(last)
+        columns["Блок"] = pd.Categorical.from_codes(columns["Блок"], categories=self.block_names)
+        columns["Статус"] = pd.Categorical.from_codes(columns["Статус"], categories=STATUSES)
+        return pd.DataFrame(columns, copy=False)
+
+    def to_arrow(self, last=None):
+        import pyarrow as pa
+
+        columns = self.columns(last)
+        columns["Блок"] = pa.DictionaryArray.from_arrays(columns["Блок"], pa.array(self.block_names))
+        columns["Статус"] = pa.DictionaryArray.from_arrays(columns["Статус"], pa.array(STATUSES))
+        return pa.table(columns)
@@ -0,0 +1,154 @@
+import heapq
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+DISPATCHER = "Диспетчер"
+GSM = "GSM"
+BLOCK = "{block}"
+
+# -------------------------------
+# Сценарії подій: (крок, від кого, кому, середня тривалість, с)
+# -------------------------------
+# Ті самі етапи А→Б→В→Г, що й у event_options, але кожен — повідомлення між
+# учасниками з тривалістю. BLOCK підставляється іменем конкретного блока.
+# Диспетчер і блок не зв'язані напряму: кожен обмін іде через GSM, тож
+# сценарії, що в event_options закінчуються на блоці, мають ще зворотний шлях.
+SCENARIOS = {
+    "Самотестування": [
+        ("А. Диспетчерська станція → GSM", DISPATCHER, GSM, 0.3),
+        ("Б. GSM → блок виносний", GSM, BLOCK, 2.0),
+        ("В. Блок тестує і повертає результат", BLOCK, GSM, 5.0),
+        ("Г. GSM → диспетчерська станція", GSM, DISPATCHER, 0.3),
+        ("Д. Вивід результату на монітор", DISPATCHER, DISPATCHER, 0.2),
+    ],
+    "Опитування сенсорів": [
+        ("А. Диспетчерська станція → GSM", DISPATCHER, GSM, 0.3),
+        ("Б. GSM → блок виносний", GSM, BLOCK, 2.0),
+        ("В. Опитування сенсорів завершено", BLOCK, BLOCK, 0.5),
+        ("Г. Блок → GSM", BLOCK, GSM, 2.0),
+        ("Д. GSM → диспетчерська станція", GSM, DISPATCHER, 0.3),
+    ],
+    "Поява льоду": [
+        ("А. Диспетчерська станція → GSM", DISPATCHER, GSM, 0.3),
+        ("Б. GSM → блок виносний", GSM, BLOCK, 2.0),
+        ("В. Команда на плавку льоду", BLOCK, BLOCK, 1.0),
+        ("Г. Включено пристрій плавлення", BLOCK, BLOCK, 0.3),
+        ("Д. Блок → GSM", BLOCK, GSM, 2.0),
+        ("Е. GSM → диспетчерська станція", GSM, DISPATCHER, 0.3),
+    ],
+    "Коротке замикання": [
+        ("А. Сенсор КЗ → блок виносний", BLOCK, BLOCK, 0.05),
+        ("Б. Блок → GSM", BLOCK, GSM, 2.0),
+        ("В. GSM → диспетчер", GSM, DISPATCHER, 0.3),
+        ("Г. Вивід на монітор", DISPATCHER, DISPATCHER, 0.2),
+    ],
+    "Обрив проводів": [
+        ("А. Сенсор обриву → блок виносний", BLOCK, BLOCK, 0.05),
+        ("Б. Блок → GSM", BLOCK, GSM, 2.0),
+        ("В. GSM → диспетчер", GSM, DISPATCHER, 0.3),
+        ("Г. Вивід на монітор", DISPATCHER, DISPATCHER, 0.2),
+    ],
+}
+
+
+class EventSimulator:
+    """Дискретно-подійна симуляція сценаріїв на купі (heapq) з модельним часом.
+
+    Кожен крок сценарію — подія в черзі з часом доставки. Годинник стрибає
+    від події до події, тому тисячі одночасних сценаріїв проганяються набагато
+    швидше за реальний час. Тривалість кроку — середня ±50% (рівномірно).
+    """
+
+    def __init__(self, scenarios=SCENARIOS, seed=None):
+        self.scenarios = scenarios
+        self.rng = np.random.default_rng(seed)
+        self.now = 0.0
+        self._queue = []
+        self._seq = itertools.count()
+        self._runs = []
+        # Колонки трасування: один запис на доставлений крок
+        self._trace = {"time": [], "run": [], "step": []}
+
+    def __len__(self):
+        return len(self._queue)
+
+    def schedule(self, delay, run, step):
+        heapq.heappush(self._queue, (self.now + delay, next(self._seq), run, step))
+
+    def _delay(self, mean):
+        return mean * (0.5 + self.rng.random())
+
+    def start(self, scenario, block, at=0.0):
+        """Запускає сценарій для блока через at секунд модельного часу; повертає id запуску."""
+        run = len(self._runs)
+        self._runs.append((scenario, block))
+        first = self.scenarios[scenario][0]
+        self.schedule(at + self._delay(first[3]), run, 0)
+        return run
+
+    def start_many(self, scenario, blocks, spread=0.0):
+        """Запускає сценарій для кожного блока зі стартом, рівномірно розкиданим у [0, spread)."""
+        offsets = self.rng.uniform(0, spread, len(blocks)) if spread else np.zeros(len(blocks))
+        return [self.start(scenario, block, at) for block, at in zip(blocks, offsets)]
+
+    def run(self, until=None):
+        """Обробляє події в порядку часу до until (або до спорожнення черги)."""
+        processed = 0
+        queue = self._queue
+        while queue and (until is None or queue[0][0] <= until):
+            self.now, _, run, step = heapq.heappop(queue)
+            self._trace["time"].append(self.now)
+            self._trace["run"].append(run)
+            self._trace["step"].append(step)
+            steps = self.scenarios[self._runs[run][0]]
+            if step + 1 < len(steps):
+                self.schedule(self._delay(steps[step + 1][3]), run, step + 1)
+            processed += 1
+        if until is not None:
+            self.now = max(self.now, until)
+        return processed
+
+    # -------------------------------
+    # Результати
+    # -------------------------------
+    def trace(self):
+        """Таблиця доставлених кроків з модельним часом у секундах."""
+        times = np.asarray(self._trace["time"])
+        runs = np.asarray(self._trace["run"], dtype=np.int64)
+        steps = np.asarray(self._trace["step"], dtype=np.int64)
+        scenario = [self._runs[r][0] for r in runs]
+        block = [self._runs[r][1] for r in runs]
+        labels, sources, targets = [], [], []
+        for name, blk, step in zip(scenario, block, steps):
+            label, src, dst, _ = self.scenarios[name][step]
+            labels.append(label)
+            sources.append(blk if src == BLOCK else src)
+            targets.append(blk if dst == BLOCK else dst)
+        return pd.DataFrame({
+            "Час, с": times,
+            "Запуск": runs,
+            "Сценарій": scenario,
+            "Блок": block,
+            "Крок": labels,
+            "Від": sources,
+            "Кому": targets,
+        })
+
+    def event_rows(self, end=None):
+        """Рядки для EventStore.insert_steps: (час, блок, сценарій, крок).
+
+        Модельний час відкладається так, щоб останній крок припав на end
+        (unix-с, типово — зараз): прогін наче щойно завершився, і жоден
+        рядок не потрапляє в майбутнє.
+        """
+        end = time.time() if end is None else end
+        trace = self.trace()
+        return zip(
+            (end - self.now + trace["Час, с"]).tolist(),
+            trace["Блок"].tolist(),
+            trace["Сценарій"].tolist(),
+            trace["Крок"].tolist(),
+        )
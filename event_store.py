@@ -0,0 +1,133 @@
+import os
+import sqlite3
+import threading
+import time
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from block_store import STATUSES
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    time        REAL NOT NULL,
+    block       TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    temperature REAL,
+    humidity    REAL,
+    wind        REAL
+);
+CREATE INDEX IF NOT EXISTS events_block_time  ON events (block, time);
+CREATE INDEX IF NOT EXISTS events_status_time ON events (status, time);
+CREATE INDEX IF NOT EXISTS events_time        ON events (time);
+CREATE TABLE IF NOT EXISTS scenario_steps (
+    time     REAL NOT NULL,
+    block    TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    step     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scenario_steps_time ON scenario_steps (time);
+"""
+
+# Справжня зона з правилами переходу на літній час, а не зсув, узятий при імпорті
+TIMEZONE_ENV = "SIMULATOR_TZ"
+LOCAL_TZ = ZoneInfo(os.environ.get(TIMEZONE_ENV) or "Europe/Kyiv")
+
+
+class EventStore:
+    """Журнал подій у вбудованій SQLite (WAL), що переживає перезапуски.
+
+    Час зберігається як unix-секунди; індекси (block, time) і (status, time)
+    покривають типові запити диспетчера: "усі Ожеледь на BB3 за 6 годин", а
+    (time) — стандартний вигляд без фільтрів: останні N подій за період.
+    Кроки змодельованих сценаріїв (EventSimulator) лежать в окремій таблиці
+    scenario_steps і не змішуються з подіями статусів.
+    """
+
+    def __init__(self, path="events.db"):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._conn.close()
+
+    # -------------------------------
+    # Запис
+    # -------------------------------
+    def insert_many(self, rows):
+        """rows — ітерабельне кортежів (time, block, status, temperature, humidity, wind)."""
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def insert_steps(self, rows):
+        """rows — ітерабельне кортежів (time, block, scenario, step) з EventSimulator.event_rows."""
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT INTO scenario_steps VALUES (?, ?, ?, ?)", rows)
+
+    def insert_store(self, store, idx, timestamp=None):
+        """Записує поточні показники блоків idx зі сховища BlockStore одним executemany."""
+        timestamp = time.time() if timestamp is None else timestamp
+        self.insert_many(zip(
+            [timestamp] * len(idx),
+            [store.names[i] for i in idx],
+            [STATUSES[code] for code in store.status[idx]],
+            store.temperature[idx].tolist(),
+            store.humidity[idx].tolist(),
+            store.wind[idx].tolist(),
+        ))
+
+    # -------------------------------
+    # Запити
+    # -------------------------------
+    def query(self, blocks=None, statuses=None, since=None, until=None, limit=1000):
+        """Найновіші події за фільтрами; порожній фільтр означає "усі"."""
+        where, params = [], []
+        if blocks:
+            where.append(f"block IN ({', '.join('?' * len(blocks))})")
+            params.extend(blocks)
+        if statuses:
+            where.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if since is not None:
+            where.append("time >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("time < ?")
+            params.append(until)
+        sql = "SELECT time, block, status, temperature, humidity, wind FROM events"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY time DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=params)
+        df.columns = ["Час", "Блок", "Статус", "Температура", "Вологість", "Вітер"]
+        df["Час"] = pd.to_datetime(df["Час"], unit="s", utc=True).dt.tz_convert(LOCAL_TZ)
+        return df
+
+    def query_steps(self, since=None, limit=1000):
+        """Найновіші кроки сценаріїв."""
+        sql = "SELECT time, block, scenario, step FROM scenario_steps"
+        params = []
+        if since is not None:
+            sql += " WHERE time >= ?"
+            params.append(since)
+        sql += " ORDER BY time DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=params)
+        df.columns = ["Час", "Блок", "Сценарій", "Крок"]
+        df["Час"] = pd.to_datetime(df["Час"], unit="s", utc=True).dt.tz_convert(LOCAL_TZ)
+        return df
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
@@ -0,0 +1,147 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import pandas as pd
+
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------
+# Приймачі (куди пишемо пакети)
+# -------------------------------
+class CsvSink:
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, frame):
+        header = not os.path.isfile(self.path)
+        frame.to_csv(self.path, mode="a", header=header, index=False, encoding="utf-8")
+
+    def close(self):
+        pass
+
+
+class ParquetSink:
+    """Каталог part-файлів: кожен скид — окремий, уже закритий файл.
+
+    pd.read_parquet(path) читає каталог цілком і під час роботи застосунку, а
+    аварійна зупинка втрачає щонайбільше скид, що саме пишеться. Якщо на місці
+    каталогу лежить старий одиночний файл, поруч створюється новий каталог.
+    """
+
+    def __init__(self, path):
+        root, ext = os.path.splitext(path)
+        if os.path.isfile(path):
+            path = f"{root}-{datetime.now().strftime('%Y%m%d-%H%M%S')}{ext}"
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        # Унікальний префікс: у каталог можуть писати кілька процесів
+        self._prefix = f"part-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self._parts = 0
+
+    def write(self, frame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Категорії — звичайними рядками: словник залежить від топології, а схема частин має збігатися
+        categorical = [column for column in frame.columns if isinstance(frame[column].dtype, pd.CategoricalDtype)]
+        frame = frame.astype({column: str for column in categorical})
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        name = f"{self._prefix}-{self._parts:05d}.parquet"
+        # Файли з крапкою на початку pyarrow пропускає — читач не побачить недописану частину
+        partial = os.path.join(self.path, f".{name}")
+        pq.write_table(table, partial)
+        os.replace(partial, os.path.join(self.path, name))
+        self._parts += 1
+
+    def close(self):
+        pass
+
+
+def sink_for(path):
+    return ParquetSink(path) if path.endswith(".parquet") else CsvSink(path)
+
+
+# -------------------------------
+# Фоновий запис журналу
+# -------------------------------
+class EventWriter:
+    """Відкладений запис журналу подій у фоновому потоці.
+
+    submit() лише кладе знімок у чергу і повертається одразу. Знімок із тим самим
+    або старішим tick для того ж джерела відкидається, тож повторні rerun-и без
+    нових замірів нічого не пишуть. Потік скидає накопичене, коли набралося
+    flush_rows рядків або минуло flush_interval секунд. Помилка запису
+    потрапляє в лог і лічильник errors, але потік працює далі.
+    """
+
+    def __init__(self, path, flush_interval=2.0, flush_rows=10_000):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.flush_rows = flush_rows
+        self.rows_written = 0
+        self.errors = 0
+        self._sink = sink_for(path)
+        self._last_tick = {}
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"EventWriter({path})", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, tick, frame, source=None):
+        with self._lock:
+            if tick <= self._last_tick.get(source, -1):
+                return False
+            self._last_tick[source] = tick
+        if not frame.empty:
+            self._queue.put(frame)
+        return True
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _run(self):
+        pending = []
+        pending_rows = 0
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                self._flush(pending)
+                self._sink.close()
+                return
+            if item is not None:
+                pending.append(item)
+                pending_rows += len(item)
+            if pending_rows >= self.flush_rows or time.monotonic() >= deadline:
+                self._flush(pending)
+                pending = []
+                pending_rows = 0
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, pending):
+        if not pending:
+            return
+        try:
+            batch = pd.concat(pending, ignore_index=True)
+            self._sink.write(batch)
+        except Exception:
+            # Пакет втрачено, але наступні скиди мають шанс — потік не падає
+            self.errors += 1
+            logger.exception("EventWriter(%s): не вдалося записати %d пакетів", self.path, len(pending))
+            return
+        self.rows_written += len(batch)
@@ -0,0 +1,86 @@
+import os
+
+import numpy as np
+import streamlit as st
+import streamlit.components.v1 as components
+
+# Статичні фронтенди без збірки: components/<назва>/index.html
+_COMPONENTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "components")
+_component = components.declare_component("graph_delta", path=os.path.join(_COMPONENTS, "graph_delta"))
+_schematic = components.declare_component("schematic_delta", path=os.path.join(_COMPONENTS, "schematic_delta"))
+
+
+class GraphFeed:
+    """Серверна половина компонента: пам'ятає, що вже надіслано фронтенду сесії.
+
+    Топологія йде у фронтенд один раз (і повторно — лише коли змінився її ключ
+    або фронтенд попросив повну синхронізацію), далі — тільки вузли, чий
+    статус змінився: {id вузла: статус}.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.nodes = None
+        self.sent = None
+        self.seq = 0
+        self.resync = None
+
+    def message(self, key, topology, statuses, resync=None):
+        statuses = np.asarray(statuses)
+        if key != self.key or resync != self.resync or self.sent is None:
+            graph = topology()
+            self.key = key
+            self.nodes = np.asarray(graph["nodes"])
+            # object, а не <U…: коротші мітки першого кадру не обрізатимуть довші пізніше
+            self.sent = statuses.astype(object)
+            self.seq += 1
+            self.resync = resync
+            return {
+                "key": key,
+                "seq": self.seq,
+                "topology": graph,
+                "statuses": dict(zip(self.nodes.tolist(), statuses.tolist())),
+            }
+        changed = np.flatnonzero(statuses != self.sent)
+        base = self.seq
+        if len(changed):
+            self.sent[changed] = statuses[changed]
+            self.seq += 1
+        return {
+            "key": key,
+            "seq": self.seq,
+            "base": base,
+            "statuses": dict(zip(self.nodes[changed].tolist(), statuses[changed].tolist())),
+        }
+
+
+def network_graph(key, topology, statuses, palette, height=520, component_key="network_graph"):
+    """Граф мережі з інкрементним перефарбовуванням.
+
+    key — хеш топології; topology — функція, що повертає {"nodes": [...],
+    "x": [...], "y": [...], "edges": [[i, j], ...], "size": [...] (необов'язково)}
+    і викликається лише для повної відправки; statuses — мітки статусів у
+    порядку вузлів; palette — {мітка: колір}.
+    """
+    message = _message(component_key, key, topology, statuses)
+    return _component(message=message, palette=palette, height=height, key=component_key, default=None)
+
+
+def schematic_overlay(key, blocks, svg, statuses, palette, height=560, component_key="schematic_overlay"):
+    """SVG-схема з індикаторами блоків, що перефарбовуються CSS-класами.
+
+    blocks — імена блоків у порядку їхніх <circle class="ind"> у схемі;
+    svg — функція, що повертає схему (schematic_svg.render) і викликається
+    лише для повної відправки; statuses — мітки статусів у тому ж порядку;
+    palette — {мітка: колір}.
+    """
+    message = _message(component_key, key, lambda: {"nodes": list(blocks), "svg": svg()}, statuses)
+    return _schematic(message=message, palette=palette, height=height, key=component_key, default=None)
+
+
+def _message(component_key, key, topology, statuses):
+    feeds = st.session_state.setdefault("_graph_feeds", {})
+    feed = feeds.setdefault(component_key, GraphFeed())
+    # Фронтенд повертає новий токен resync, коли просить повну синхронізацію (перезавантажено iframe тощо)
+    reply = st.session_state.get(component_key) or {}
+    return feed.message(key, topology, statuses, reply.get("resync"))
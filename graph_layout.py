@@ -0,0 +1,114 @@
+import functools
+import hashlib
+import math
+
+import networkx as nx
+
+# Відстань між сусідніми вузлами на полотні vis.js, px
+NODE_SPACING = 120
+# До цього розміру — силова розкладка networkx (щільна, на numpy), далі — радіальна за O(n)
+SPRING_MAX_NODES = 500
+# Скільки розкладок (по одній на топологію) тримає кеш застосунків
+CACHE_ENTRIES = 8
+
+
+def topology_key(edges, nodes=()):
+    """Хеш топології: однаковий набір вузлів і ребер дає однаковий ключ незалежно від порядку."""
+    digest = hashlib.sha1()
+    names = set(nodes)
+    pairs = set()
+    for source, target in edges:
+        names.update((source, target))
+        pairs.add((source, target) if str(source) <= str(target) else (target, source))
+    for name in sorted(map(str, names)):
+        digest.update(name.encode("utf-8") + b"\0")
+    digest.update(b"\1")
+    for source, target in sorted(pairs, key=lambda pair: (str(pair[0]), str(pair[1]))):
+        digest.update(f"{source}\0{target}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def radial_layout(graph, root=None):
+    """Дерево обходу в ширину від root на концентричних колах.
+
+    Кожне піддерево отримує сектор, пропорційний кількості його листків, тож
+    радіальні фідери не перетинаються. Незв'язні частини чіпляються до
+    тимчасового центру. Кореневий вузол за замовчуванням — найбільшого ступеня.
+    """
+    hub = object()
+    tree_graph = graph
+    if not nx.is_connected(graph):
+        tree_graph = graph.copy()
+        tree_graph.add_edges_from((hub, min(part, key=str)) for part in nx.connected_components(graph))
+        root = hub
+    elif root is None:
+        root = max(graph.degree, key=lambda item: item[1])[0]
+    tree = nx.bfs_tree(tree_graph, root)
+    order = list(tree)
+    leaves = {}
+    for node in reversed(order):
+        leaves[node] = sum(leaves[child] for child in tree.succ[node]) or 1
+    depth = {root: 0}
+    start = {root: 0.0}
+    span = {root: 2 * math.pi}
+    for node in order:
+        offset = start[node]
+        for child in tree.succ[node]:
+            depth[child] = depth[node] + 1
+            start[child] = offset
+            span[child] = span[node] * leaves[child] / leaves[node]
+            offset += span[child]
+    # Радіус кола: на крок далі за попереднє, але щоб вузли на ньому стояли не тісніше NODE_SPACING
+    counts = [0] * (max(depth.values()) + 1)
+    for node in order:
+        counts[depth[node]] += 1
+    radii = [0.0]
+    for count in counts[1:]:
+        radii.append(max(radii[-1] + NODE_SPACING, NODE_SPACING * count / (2 * math.pi)))
+    pos = {}
+    for node in order:
+        if node is hub:
+            continue
+        angle = start[node] + span[node] / 2
+        radius = radii[depth[node]]
+        pos[node] = (radius * math.cos(angle), radius * math.sin(angle))
+    return pos
+
+
+def compute_layout(edges, nodes=(), seed=0, iterations=50):
+    """Координати вузлів {вузол: (x, y)} у пікселях — один раз на топологію.
+
+    Невеликі мережі розкладаються силовим методом networkx з фіксованим seed
+    (стартуючи з радіальної розкладки), великі — радіальною за O(n). Та сама
+    топологія завжди дає ту саму картинку, а браузеру не треба рахувати фізику.
+    """
+    # Сортування робить розкладку незалежною від порядку, в якому прийшли вузли й ребра
+    graph = nx.Graph()
+    graph.add_nodes_from(sorted(nodes, key=str))
+    pairs = (tuple(sorted(edge, key=str)) for edge in edges)
+    graph.add_edges_from(sorted(pairs, key=lambda pair: (str(pair[0]), str(pair[1]))))
+    if not len(graph):
+        return {}
+    pos = radial_layout(graph)
+    if len(graph) < SPRING_MAX_NODES:
+        scale = NODE_SPACING * math.sqrt(len(graph))
+        pos = nx.spring_layout(graph, pos=pos, seed=seed, iterations=iterations, scale=scale)
+    return {node: (round(float(x), 1), round(float(y), 1)) for node, (x, y) in pos.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_compute():
+    # Streamlit потрібен лише застосункам: модуль імпортується і без нього
+    import streamlit as st
+
+    @st.cache_data(max_entries=CACHE_ENTRIES)
+    def layout_for(key, _edges, _nodes):
+        # Координати вузлів рахуються один раз на топологію; ключ кешу — її хеш
+        return compute_layout(_edges, _nodes)
+
+    return layout_for
+
+
+def cached_layout(key, edges, nodes=()):
+    """compute_layout у кеші Streamlit, спільному для сесій; key — хеш топології (topology_key, Topology.key)."""
+    return _cached_compute()(key, edges, nodes)
@@ -0,0 +1,159 @@
+import argparse
+import heapq
+import itertools
+
+import numpy as np
+
+# Типи подій у черзі
+_REQUEST_ARRIVED, _RESPONSE_ARRIVED, _TIMEOUT = range(3)
+
+
+class GsmChannel:
+    """Модель GSM-каналу між диспетчером і блоками.
+
+    Канал має два напрямки (до блоків і від блоків), кожен — одна черга FIFO
+    зі швидкістю bandwidth_bps: повідомлення займає канал на size * 8 / bandwidth
+    секунд. Після передачі додається затримка мережі (логнормальна з медіаною
+    latency_median), повідомлення губиться з імовірністю loss. Диспетчер тримає
+    не більше window опитувань у польоті й повторює запит після timeout до
+    retries разів.
+    """
+
+    def __init__(self, bandwidth_bps=9600, latency_median=0.3, latency_sigma=0.5, loss=0.01,
+                 timeout=5.0, retries=3, request_bytes=32, response_bytes=128, window=20):
+        self.bandwidth_bps = bandwidth_bps
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.loss = loss
+        self.timeout = timeout
+        self.retries = retries
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+        self.window = window
+
+    def _latency(self, rng):
+        return self.latency_median * rng.lognormal(0.0, self.latency_sigma)
+
+    def poll_cycle(self, n_blocks, rng):
+        """Одне опитування всіх блоків.
+
+        Повертає (час від першого запиту до відповіді, спроби, кінець циклу).
+        Для блоків, які так і не відповіли, час відповіді — NaN; кінець циклу
+        враховує і їх.
+        """
+        request_tx = self.request_bytes * 8 / self.bandwidth_bps
+        response_tx = self.response_bytes * 8 / self.bandwidth_bps
+        done = np.full(n_blocks, np.nan)
+        attempts = np.zeros(n_blocks, dtype=np.int32)
+        sent_at = np.zeros(n_blocks)
+        first_sent = np.zeros(n_blocks)
+        queue = []
+        seq = itertools.count()
+        down_free = up_free = 0.0
+        pending = iter(range(n_blocks))
+        cycle_end = 0.0
+
+        def send(block, now):
+            nonlocal down_free
+            if not attempts[block]:
+                first_sent[block] = now
+            attempts[block] += 1
+            sent_at[block] = now
+            start = max(now, down_free)
+            down_free = start + request_tx
+            if rng.random() < self.loss:
+                heapq.heappush(queue, (now + self.timeout, next(seq), _TIMEOUT, block))
+            else:
+                heapq.heappush(queue, (down_free + self._latency(rng), next(seq), _REQUEST_ARRIVED, block))
+
+        def next_block(now):
+            block = next(pending, None)
+            if block is not None:
+                send(block, now)
+
+        for _ in range(min(self.window, n_blocks)):
+            next_block(0.0)
+
+        while queue:
+            now, _, kind, block = heapq.heappop(queue)
+            cycle_end = now
+            if kind == _REQUEST_ARRIVED:
+                start = max(now, up_free)
+                up_free = start + response_tx
+                arrival = up_free + self._latency(rng)
+                deadline = sent_at[block] + self.timeout
+                if rng.random() < self.loss or arrival > deadline:
+                    heapq.heappush(queue, (deadline, next(seq), _TIMEOUT, block))
+                else:
+                    heapq.heappush(queue, (arrival, next(seq), _RESPONSE_ARRIVED, block))
+            elif kind == _RESPONSE_ARRIVED:
+                done[block] = now
+                next_block(now)
+            elif attempts[block] <= self.retries:
+                send(block, now)
+            else:
+                next_block(now)
+        return done - first_sent, attempts, cycle_end
+
+
+def report(channel, n_blocks, cycles=10, seed=None):
+    """Прогони cycles опитувань і зведення: p50/p99 циклу та окремого опитування."""
+    rng = np.random.default_rng(seed)
+    cycle_times, poll_times, failed, retried = [], [], 0, 0
+    for _ in range(cycles):
+        latency, attempts, cycle_end = channel.poll_cycle(n_blocks, rng)
+        ok = ~np.isnan(latency)
+        cycle_times.append(cycle_end)
+        poll_times.append(latency[ok])
+        failed += int((~ok).sum())
+        retried += int((attempts > 1).sum())
+    cycle_times = np.asarray(cycle_times)
+    polls = np.concatenate(poll_times)
+    return {
+        "blocks": n_blocks,
+        "cycles": cycles,
+        "cycle_p50": float(np.percentile(cycle_times, 50)),
+        "cycle_p99": float(np.percentile(cycle_times, 99)),
+        "poll_p50": float(np.percentile(polls, 50)) if len(polls) else float("nan"),
+        "poll_p99": float(np.percentile(polls, 99)) if len(polls) else float("nan"),
+        "throughput": len(polls) / float(cycle_times.sum()) if len(polls) else 0.0,
+        "failed": failed,
+        "retried": retried,
+    }
+
+
+def format_report(result):
+    return "\n".join([
+        f"Блоків: {result['blocks']}, циклів: {result['cycles']}",
+        f"Цикл опитування: p50 {result['cycle_p50']:.1f} с, p99 {result['cycle_p99']:.1f} с",
+        f"Час до відповіді блока: p50 {result['poll_p50']:.2f} с, p99 {result['poll_p99']:.2f} с",
+        f"Пропускна здатність: {result['throughput']:.1f} опитувань/с",
+        f"Повторних запитів: {result['retried']}, без відповіді: {result['failed']}",
+    ])
+
+
+def add_arguments(parser):
+    parser.add_argument("--blocks", type=int, default=10_000)
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--bandwidth", type=int, default=9600, help="біт/с в кожному напрямку")
+    parser.add_argument("--latency", type=float, default=0.3, help="медіана затримки, с")
+    parser.add_argument("--jitter", type=float, default=0.5, help="sigma логнормальної затримки")
+    parser.add_argument("--loss", type=float, default=0.01)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--window", type=int, default=20, help="опитувань у польоті одночасно")
+
+
+def channel_from_args(args):
+    return GsmChannel(
+        bandwidth_bps=args.bandwidth, latency_median=args.latency, latency_sigma=args.jitter,
+        loss=args.loss, timeout=args.timeout, retries=args.retries, window=args.window,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Модель GSM-каналу: час циклу опитування сенсорів")
+    add_arguments(parser)
+    args = parser.parse_args()
+    print(format_report(report(channel_from_args(args), args.blocks, args.cycles, args.seed)))
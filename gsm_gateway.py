@@ -0,0 +1,285 @@
+import argparse
+import asyncio
+import struct
+import threading
+import time
+
+import numpy as np
+
+from telemetry import HUMIDITY_RANGE, TEMPERATURE_RANGE, WIND_RANGE
+
+# -------------------------------
+# Протокол: кадри фіксованої довжини (однакові для UDP і TCP)
+# -------------------------------
+# тип, id блока, номер/код, температура, вологість, вітер
+FRAME = struct.Struct("<cIIfff")
+
+REPORT       = b"R"  # блок → шлюз: показники
+ACK          = b"A"  # шлюз → блок: звіт прийнято
+COMMAND      = b"C"  # шлюз → блок: команда диспетчера
+COMMAND_DONE = b"K"  # блок → шлюз: команду виконано
+
+COMMANDS = {
+    1: "Самотестування",
+    2: "Опитування сенсорів",
+    3: "Плавка льоду",
+}
+
+
+class GatewayState:
+    """Зведений стан, який шлюз збирає зі звітів блоків (читається з потоку Streamlit)."""
+
+    def __init__(self, n_blocks):
+        self.n_blocks = n_blocks
+        self.temperature = np.full(n_blocks, np.nan)
+        self.humidity = np.full(n_blocks, np.nan)
+        self.wind = np.full(n_blocks, np.nan)
+        self.last_seen = np.zeros(n_blocks)
+        self.reports = np.zeros(n_blocks, dtype=np.int64)
+        self.reports_total = 0
+        self.commands_sent = 0
+        self.commands_done = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, n_blocks):
+        """Розширює стан до n_blocks блоків (не зменшує): один шлюз обслуговує топології різного розміру."""
+        with self._lock:
+            extra = n_blocks - self.n_blocks
+            if extra <= 0:
+                return
+            self.temperature = np.concatenate([self.temperature, np.full(extra, np.nan)])
+            self.humidity = np.concatenate([self.humidity, np.full(extra, np.nan)])
+            self.wind = np.concatenate([self.wind, np.full(extra, np.nan)])
+            self.last_seen = np.concatenate([self.last_seen, np.zeros(extra)])
+            self.reports = np.concatenate([self.reports, np.zeros(extra, dtype=np.int64)])
+            self.n_blocks = n_blocks
+
+    def ingest(self, block, temperature, humidity, wind):
+        with self._lock:
+            self.temperature[block] = temperature
+            self.humidity[block] = humidity
+            self.wind[block] = wind
+            self.last_seen[block] = time.time()
+            self.reports[block] += 1
+            self.reports_total += 1
+
+    def snapshot(self, since=0.0, n_blocks=None):
+        """Індекси блоків (з перших n_blocks) зі звітами новішими за since і їхні показники (копії)."""
+        with self._lock:
+            idx = np.flatnonzero(self.last_seen[:n_blocks] > since)
+            return idx, self.temperature[idx], self.humidity[idx], self.wind[idx]
+
+
+class _GatewayUdp(asyncio.DatagramProtocol):
+    def __init__(self, gateway):
+        self.gateway = gateway
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        send = lambda frame: self.transport.sendto(frame, addr)  # noqa: E731
+        self.gateway.handle_frame(data, send)
+
+
+class GsmGateway:
+    """Локальна заміна GSM-вузла: приймає звіти й відповіді на команди по UDP і TCP.
+
+    Усі сесії обслуговуються одним циклом asyncio; для кожного блока шлюз
+    пам'ятає, як йому відповісти, щоб доставляти команди диспетчера.
+    """
+
+    def __init__(self, n_blocks, host="127.0.0.1", udp_port=0, tcp_port=0):
+        self.state = GatewayState(n_blocks)
+        self.host = host
+        self.udp_port = udp_port
+        self.tcp_port = tcp_port
+        self._routes = {}
+        self._udp = None
+        self._tcp = None
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        self._udp, _ = await loop.create_datagram_endpoint(
+            lambda: _GatewayUdp(self), local_addr=(self.host, self.udp_port)
+        )
+        self.udp_port = self._udp.get_extra_info("sockname")[1]
+        self._tcp = await asyncio.start_server(self._serve_tcp, self.host, self.tcp_port)
+        self.tcp_port = self._tcp.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._udp is not None:
+            self._udp.close()
+        if self._tcp is not None:
+            self._tcp.close()
+            await self._tcp.wait_closed()
+
+    def handle_frame(self, data, send):
+        if len(data) != FRAME.size:
+            return
+        kind, block, number, temperature, humidity, wind = FRAME.unpack(data)
+        if block >= self.state.n_blocks:
+            return
+        self._routes[block] = send
+        if kind == REPORT:
+            self.state.ingest(block, temperature, humidity, wind)
+            send(FRAME.pack(ACK, block, number, 0.0, 0.0, 0.0))
+        elif kind == COMMAND_DONE:
+            self.state.commands_done += 1
+
+    async def _serve_tcp(self, reader, writer):
+        try:
+            while True:
+                data = await reader.readexactly(FRAME.size)
+                self.handle_frame(data, writer.write)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def send_command(self, block, code):
+        """Надсилає команду блоку; False, якщо блок ще не виходив на зв'язок."""
+        send = self._routes.get(block)
+        if send is None:
+            return False
+        send(FRAME.pack(COMMAND, block, code, 0.0, 0.0, 0.0))
+        self.state.commands_sent += 1
+        return True
+
+
+class GatewayThread:
+    """Шлюз у власному потоці з окремим циклом asyncio — для Streamlit і тестів навантаження."""
+
+    def __init__(self, n_blocks, host="127.0.0.1", udp_port=0, tcp_port=0):
+        self.gateway = GsmGateway(n_blocks, host, udp_port, tcp_port)
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="GsmGateway", daemon=True)
+
+    @property
+    def state(self):
+        return self.gateway.state
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self.gateway.start())
+        self._ready.set()
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """Запускає корутину в циклі шлюзу; повертає concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def send_command(self, block, code):
+        self.loop.call_soon_threadsafe(self.gateway.send_command, block, code)
+
+    def stop(self):
+        self.submit(self.gateway.stop()).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
+# -------------------------------
+# Імітація парку блоків
+# -------------------------------
+class _FleetUdp(asyncio.DatagramProtocol):
+    def __init__(self, stats):
+        self.stats = stats
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        _reply(data, self.transport.sendto, self.stats)
+
+
+def _reply(data, send, stats):
+    kind, block, number, *_ = FRAME.unpack(data)
+    if kind == ACK:
+        stats["acks"] += 1
+    elif kind == COMMAND:
+        stats["commands"] += 1
+        send(FRAME.pack(COMMAND_DONE, block, number, 0.0, 0.0, 0.0))
+
+
+async def run_fleet(host, udp_port, tcp_port, n_blocks, interval=1.0, duration=10.0,
+                    transport="udp", connections=64, seed=None,
+                    temperature=TEMPERATURE_RANGE, humidity=HUMIDITY_RANGE, wind=WIND_RANGE):
+    """Тисячі блоків-корутин, що звітують кожні ~interval с і виконують команди.
+
+    Блоки мультиплексуються на connections сокетів (id блока є в кадрі), щоб
+    не впиратися в ліміт дескрипторів. Діапазони показників — як у
+    TelemetryGenerator (передаються через **generator.ranges).
+    """
+    loop = asyncio.get_running_loop()
+    rng = np.random.default_rng(seed)
+    stats = {"sent": 0, "acks": 0, "commands": 0}
+    senders, closers = [], []
+    for _ in range(min(connections, n_blocks)):
+        if transport == "udp":
+            udp, _ = await loop.create_datagram_endpoint(lambda: _FleetUdp(stats), remote_addr=(host, udp_port))
+            senders.append(udp.sendto)
+            closers.append(udp.close)
+        else:
+            reader, writer = await asyncio.open_connection(host, tcp_port)
+            senders.append(writer.write)
+            closers.append(writer.close)
+            loop.create_task(_read_tcp(reader, writer, stats))
+
+    low = np.array([temperature[0], humidity[0], wind[0]])
+    high = np.array([temperature[1], humidity[1], wind[1]])
+    deadline = loop.time() + duration
+
+    async def block_session(block):
+        send = senders[block % len(senders)]
+        number = 0
+        await asyncio.sleep(rng.uniform(0, interval))
+        while loop.time() < deadline:
+            t, h, w = np.round(rng.uniform(low, high), 1)
+            send(FRAME.pack(REPORT, block, number, t, h, w))
+            stats["sent"] += 1
+            number += 1
+            await asyncio.sleep(interval * rng.uniform(0.8, 1.2))
+
+    await asyncio.gather(*(block_session(block) for block in range(n_blocks)))
+    for close in closers:
+        close()
+    return stats
+
+
+async def _read_tcp(reader, writer, stats):
+    try:
+        while True:
+            _reply(await reader.readexactly(FRAME.size), writer.write, stats)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Локальний GSM-шлюз і тест навантаження блоками")
+    parser.add_argument("--blocks", type=int, default=5000)
+    parser.add_argument("--interval", type=float, default=1.0, help="період звітів блока, с")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--transport", choices=["udp", "tcp"], default="udp")
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    gateway = GatewayThread(args.blocks).start()
+    started = time.perf_counter()
+    # Парк блоків — у головному потоці з власним циклом, шлюз — у своєму
+    stats = asyncio.run(run_fleet(
+        gateway.gateway.host, gateway.gateway.udp_port, gateway.gateway.tcp_port, args.blocks,
+        args.interval, args.duration, args.transport, args.connections, args.seed,
+    ))
+    elapsed = time.perf_counter() - started
+    state = gateway.state
+    gateway.stop()
+    print(f"Блоків: {args.blocks} ({args.transport}), тривалість {elapsed:.1f} с")
+    print(f"Надіслано звітів: {stats['sent']}, прийнято шлюзом: {state.reports_total}, ACK: {stats['acks']}")
+    print(f"Прийом: {state.reports_total / elapsed:,.0f} звітів/с; блоків на зв'язку: {int((state.reports > 0).sum())}")
@@ -0,0 +1,94 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CAPACITY = 240
+MIN_CAPACITY = 10
+# Скільки пам'яті на сесію може зайняти історія (МБ); змінна середовища — щоб змінити
+DEFAULT_BUDGET_MB = 32
+BUDGET_ENV = "SIMULATOR_HISTORY_MB"
+
+METRICS = ("Температура", "Вологість", "Вітер")
+
+
+def budget_from_env(default=DEFAULT_BUDGET_MB):
+    value = os.environ.get(BUDGET_ENV, "").strip()
+    return float(value) if value else default
+
+
+def capacity_for(n_blocks, budget_mb=DEFAULT_BUDGET_MB, limit=DEFAULT_CAPACITY):
+    """Глибина історії, що вміщається в budget_mb для n_blocks блоків (від MIN_CAPACITY до limit).
+
+    Кожен тік — три float32 на блок: 50k блоків дають ~0.6 МБ на тік.
+    """
+    per_tick = len(METRICS) * max(n_blocks, 1) * np.dtype(np.float32).itemsize
+    return int(min(max(budget_mb * 2**20 // per_tick, MIN_CAPACITY), limit))
+
+
+class TelemetryHistory:
+    """Історія показників (метрика × блок × час) у попередньо виділеному кільці.
+
+    Один тік — це один стовпчик для всіх блоків, тож запис коштує O(blocks)
+    і не створює жодних об'єктів на рядок. Блоки, які в тіку не оновлювались
+    (вимкнені), отримують NaN — на графіку це розрив лінії.
+
+    Масиви виділяються на першому тіку: сесія, що не оновлювала стан,
+    пам'яті під історію не займає.
+    """
+
+    def __init__(self, n_blocks, capacity=DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("Глибина історії має бути додатною")
+        self.n_blocks = n_blocks
+        self.capacity = capacity
+        self.values = None
+        # Мілісекунди: у живому режимі тік буває частіше за раз на секунду
+        self.time = np.zeros(capacity, dtype="datetime64[ms]")
+        self.size = 0
+        self.version = 0
+        self._head = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, temperature, humidity, wind, time, mask=None):
+        """Додає один тік; mask — які блоки мають свіжі значення."""
+        if self.values is None:
+            self.values = np.full((len(METRICS), self.n_blocks, self.capacity), np.nan, dtype=np.float32)
+        column = self.values[:, :, self._head]
+        column[0] = temperature
+        column[1] = humidity
+        column[2] = wind
+        if mask is not None:
+            column[:, ~mask] = np.nan
+        self.time[self._head] = time
+        self._head = (self._head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.version += 1
+
+    def append_store(self, store, idx, time):
+        mask = np.zeros(len(store), dtype=bool)
+        mask[idx] = True
+        self.append(store.temperature, store.humidity, store.wind, np.datetime64(time, "ms"), mask)
+
+    def _positions(self, last=None):
+        size = self.size if last is None else min(last, self.size)
+        start = self._head - size
+        if start >= 0:
+            return slice(start, self._head)
+        # Вікно перетинає межу кільця — індекси в хронологічному порядку
+        return (start + np.arange(size)) % self.capacity
+
+    def series(self, metric, block_idx, last=None):
+        """Час і значення metric для блоків block_idx: масив (len(block_idx), T)."""
+        positions = self._positions(last)
+        if self.values is None:
+            return self.time[:0], np.empty((len(block_idx), 0), dtype=np.float32)
+        rows = self.values[METRICS.index(metric), block_idx]
+        return self.time[positions], rows[:, positions]
+
+    def frame(self, metric, block_idx, block_names, last=None):
+        """Широка таблиця для st.line_chart: індекс — час, колонки — блоки."""
+        times, values = self.series(metric, block_idx, last)
+        return pd.DataFrame(values.T, index=pd.Index(times, name="Час"), columns=[block_names[i] for i in block_idx])
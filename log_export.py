@@ -0,0 +1,53 @@
+import contextlib
+import gzip
+import io
+
+CHUNK_ROWS = 50_000
+
+# Назва в інтерфейсі → (стиснення, розширення файлу, MIME)
+FORMATS = {
+    "CSV": (None, ".csv", "text/csv"),
+    "CSV + gzip": ("gzip", ".csv.gz", "application/gzip"),
+    "CSV + zstd": ("zstd", ".csv.zst", "application/zstd"),
+}
+
+
+def available_formats():
+    formats = list(FORMATS)
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        formats.remove("CSV + zstd")
+    return formats
+
+
+def iter_csv_chunks(frame, chunk_rows=CHUNK_ROWS):
+    """CSV частинами по chunk_rows рядків — без рядка на весь журнал."""
+    if frame.empty:
+        yield frame.to_csv(index=False).encode("utf-8")
+        return
+    for start in range(0, len(frame), chunk_rows):
+        chunk = frame.iloc[start:start + chunk_rows]
+        yield chunk.to_csv(index=False, header=start == 0).encode("utf-8")
+
+
+def _open_compressed(buffer, compression):
+    if compression is None:
+        return contextlib.nullcontext(buffer)
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=6)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).stream_writer(buffer, closefd=False)
+    raise ValueError(f"Невідоме стиснення: {compression}")
+
+
+def export_csv(frame, compression=None, chunk_rows=CHUNK_ROWS):
+    """Пише журнал у CSV потоково, стискаючи кожну частину одразу."""
+    buffer = io.BytesIO()
+    with _open_compressed(buffer, compression) as out:
+        for chunk in iter_csv_chunks(frame, chunk_rows):
+            out.write(chunk)
+    return buffer.getvalue()
+
@@ -0,0 +1,107 @@
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from block_store import BREAK, ICE, classify
+from telemetry import HUMIDITY_RANGE, TEMPERATURE_RANGE, WIND_RANGE, TelemetryGenerator
+
+# Скільки тіків генерувати за раз у воркері — не більше за це число
+TICK_CHUNK = 256
+# Скільки замірів (сезон × тік × блок) у пакеті: близько 100 МБ пам'яті воркера
+CHUNK_ELEMENTS = 2_000_000
+
+
+def simulate_seasons(seed, trials, blocks, ticks, temperature=TEMPERATURE_RANGE,
+                     humidity=HUMIDITY_RANGE, wind=WIND_RANGE):
+    """Воркер: trials сезонів фідера з blocks блоків по ticks замірів, векторизовано.
+
+    Для кожного сезону повертає кількість замірів зі статусом Ожеледь / Порив
+    по всьому фідеру і номер тіку першої події (ticks, якщо подій не було).
+    """
+    telemetry = TelemetryGenerator(seed, temperature, humidity, wind)
+    ice = np.zeros(trials, dtype=np.int64)
+    gust = np.zeros(trials, dtype=np.int64)
+    first_ice = np.full(trials, ticks, dtype=np.int64)
+    first_gust = np.full(trials, ticks, dtype=np.int64)
+    # Тіків у пакеті стільки, щоб trials × chunk × blocks вмістилось у CHUNK_ELEMENTS
+    step = max(1, min(TICK_CHUNK, CHUNK_ELEMENTS // (trials * blocks)))
+    for start in range(0, ticks, step):
+        chunk = min(step, ticks - start)
+        status = classify(*telemetry.sample(trials * chunk * blocks)).reshape(trials, chunk, blocks)
+        for code, counts, first in ((ICE, ice, first_ice), (BREAK, gust, first_gust)):
+            matched = status == code
+            hit = matched.any(axis=2)
+            counts += matched.sum(axis=(1, 2))
+            seen = hit.any(axis=1)
+            first[:] = np.where(seen & (first == ticks), start + hit.argmax(axis=1), first)
+    return {"ice": ice, "gust": gust, "first_ice": first_ice, "first_gust": first_gust}
+
+
+class RiskEstimate:
+    """Потокове зведення результатів воркерів: ймовірності, довірчі інтервали, збіжність."""
+
+    def __init__(self, ticks):
+        self.ticks = ticks
+        self.trials = 0
+        self.any_ice = 0
+        self.any_gust = 0
+        self.any_event = 0
+        self.parts = {"ice": [], "gust": [], "first_ice": [], "first_gust": []}
+        self.convergence = []
+
+    def add(self, result):
+        ice_hit = result["first_ice"] < self.ticks
+        gust_hit = result["first_gust"] < self.ticks
+        self.trials += len(ice_hit)
+        self.any_ice += int(ice_hit.sum())
+        self.any_gust += int(gust_hit.sum())
+        self.any_event += int((ice_hit | gust_hit).sum())
+        for key, values in result.items():
+            self.parts[key].append(values)
+        self.convergence.append({
+            "Сезонів": self.trials,
+            "P(Ожеледь)": self.p_ice,
+            "P(Порив)": self.p_gust,
+            "P(будь-яка)": self.p_any,
+            "±95%": self.half_width(self.p_any),
+        })
+
+    @property
+    def p_ice(self):
+        return self.any_ice / self.trials if self.trials else float("nan")
+
+    @property
+    def p_gust(self):
+        return self.any_gust / self.trials if self.trials else float("nan")
+
+    @property
+    def p_any(self):
+        return self.any_event / self.trials if self.trials else float("nan")
+
+    def half_width(self, p):
+        """Півширина 95% довірчого інтервалу (нормальне наближення)."""
+        return 1.96 * math.sqrt(p * (1 - p) / self.trials) if self.trials else float("nan")
+
+    def values(self, key):
+        return np.concatenate(self.parts[key]) if self.parts[key] else np.empty(0, dtype=np.int64)
+
+
+def run(trials, blocks, ticks, seed=None, workers=None, shard_trials=500, **ranges):
+    """Розбиває trials сезонів на шарди з незалежними seed і ганяє їх у пулі процесів.
+
+    Генератор: після кожного завершеного шарда віддає оновлений RiskEstimate,
+    тож оцінку й збіжність можна показувати ще до кінця прогону.
+    """
+    n_shards = max(math.ceil(trials / shard_trials), 1)
+    seeds = np.random.SeedSequence(seed).spawn(n_shards)
+    sizes = [min(shard_trials, trials - i * shard_trials) for i in range(n_shards)]
+    estimate = RiskEstimate(ticks)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(simulate_seasons, shard_seed, size, blocks, ticks, **ranges)
+            for shard_seed, size in zip(seeds, sizes)
+        ]
+        for future in as_completed(futures):
+            estimate.add(future.result())
+            yield estimate
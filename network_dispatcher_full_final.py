@@ -1,60 +1,105 @@
 
 import streamlit as st
-import random
+import numpy as np
 import pandas as pd
 import time
-from datetime import datetime
-from streamlit_agraph import agraph, Node, Edge, Config
+
+from block_store import ICE, OFF, STATUSES
+from derived_frames import DerivedFrames
+from event_sim import SCENARIOS, EventSimulator
+from event_store import EventStore
+from graph_component import network_graph
+from graph_layout import cached_layout
+from gsm_gateway import GatewayThread, run_fleet
+from log_export import FORMATS, available_formats, export_csv
+import montecarlo
+from scenario_player import ScenarioPlayer, play
+from telemetry import TelemetryGenerator, seed_from_env
+import topology
 
 st.set_page_config(layout="wide")
 st.title("🔌 Повний симулятор мережі з диспетчерською, графом, подіями та журналом")
 
+
+@st.cache_resource
+def get_event_store(path):
+    # Одна SQLite-база на всі сесії; історія зберігається між перезапусками
+    return EventStore(path)
+
+
+@st.cache_resource
+def get_gateway():
+    # Один локальний GSM-шлюз (UDP/TCP) у фоновому потоці на процес: спільний для всіх
+    # сесій і топологій, стан розширюється під більшу топологію замість нового потоку
+    return GatewayThread(0).start()
+
+
+# Більше перемикачів у боковій панелі Streamlit не витягне
+MAX_SIDEBAR_TOGGLES = 50
+
 # -------------------------------
 # Ініціалізація стану
 # -------------------------------
-if "blocks" not in st.session_state:
-    st.session_state.blocks = {
-        f"TP{i}": {
-            "enabled": True,
-            "temperature": 0,
-            "humidity": 0,
-            "wind": 0,
-            "status": "Норма"
-        } for i in range(1, 5)
-    }
-if "events" not in st.session_state:
-    st.session_state.events = []
+st.sidebar.title("⚙️ Керування блоками")
+network = topology.select("dispatcher.json")
+
+if st.session_state.get("topology_key") != network.key:
+    # Нова топологія — новий стан блоків і похідні таблиці сесії
+    st.session_state.topology_key = network.key
+    st.session_state.blocks = network.block_store()
+    st.session_state.derived = DerivedFrames()
+if "telemetry" not in st.session_state:
+    st.session_state.telemetry = TelemetryGenerator(seed_from_env(), humidity=(40, 100), wind=(0, 35))
+if "player" not in st.session_state:
+    st.session_state.player = ScenarioPlayer(interval=0.7)
+if "gateway_pulled" not in st.session_state:
+    st.session_state.gateway_pulled = 0.0
+blocks = st.session_state.blocks
+derived = st.session_state.derived
+telemetry = st.session_state.telemetry
+event_store = get_event_store("events.db")
 
 # -------------------------------
 # 🔌 Бокова панель перемикачів
 # -------------------------------
-st.sidebar.title("⚙️ Керування блоками")
-for name, blk in st.session_state.blocks.items():
-    blk["enabled"] = st.sidebar.toggle(f"{name}: {'🟢' if blk['enabled'] else '🔴'}", value=blk["enabled"])
+for name, blk in list(blocks.items())[:MAX_SIDEBAR_TOGGLES]:
+    blk.enabled = st.sidebar.toggle(f"{name}: {'🟢' if blk.enabled else '🔴'}", value=blk.enabled)
+if len(blocks) > MAX_SIDEBAR_TOGGLES:
+    st.sidebar.caption(f"…і ще {len(blocks) - MAX_SIDEBAR_TOGGLES} блоків (керування — з панелі диспетчера)")
+
+seed = st.sidebar.number_input("🎲 Seed телеметрії", min_value=0, value=telemetry.seed, step=1)
+if seed != telemetry.seed:
+    telemetry.reseed(seed)
+
+source = st.sidebar.radio("📡 Джерело телеметрії", ["Генератор", "GSM-шлюз"])
+if source == "GSM-шлюз":
+    gateway = get_gateway()
+    gateway.state.reserve(len(blocks))
+    st.sidebar.caption(
+        f"UDP :{gateway.gateway.udp_port}, TCP :{gateway.gateway.tcp_port} — "
+        f"звітів {gateway.state.reports_total}, "
+        f"блоків на зв'язку {int((gateway.state.reports[:len(blocks)] > 0).sum())}"
+    )
+    if st.sidebar.button("🚀 Імітувати блоки (5 хв)"):
+        gateway.submit(run_fleet(
+            gateway.gateway.host, gateway.gateway.udp_port, gateway.gateway.tcp_port,
+            len(blocks), interval=1.0, duration=300.0, seed=telemetry.seed, **telemetry.ranges,
+        ))
 
 # -------------------------------
 # 🔁 Оновлення параметрів
 # -------------------------------
 if st.button("🔁 Оновити параметри блоків"):
-    for name, blk in st.session_state.blocks.items():
-        if blk["enabled"]:
-            blk["temperature"] = round(random.uniform(-15, 10), 1)
-            blk["humidity"] = round(random.uniform(40, 100), 1)
-            blk["wind"] = round(random.uniform(0, 35), 1)
-            if blk["temperature"] < -5 and blk["humidity"] > 80:
-                blk["status"] = "Ожеледь"
-            elif blk["wind"] > 25:
-                blk["status"] = "Порив"
-            else:
-                blk["status"] = "Норма"
-            st.session_state.events.append({
-                "Час": datetime.now().strftime("%H:%M:%S"),
-                "Блок": name,
-                "Статус": blk["status"],
-                "Температура": blk["temperature"],
-                "Вологість": blk["humidity"],
-                "Вітер": blk["wind"]
-            })
+    if source == "GSM-шлюз":
+        # Беремо лише звіти, що надійшли на шлюз після попереднього оновлення
+        pulled_at = time.time()
+        idx, t, h, w = gateway.state.snapshot(since=st.session_state.gateway_pulled, n_blocks=len(blocks))
+        st.session_state.gateway_pulled = pulled_at
+        blocks.update_at(idx, np.round(t, 1), np.round(h, 1), np.round(w, 1))
+        updated = idx[blocks.enabled[idx]]
+    else:
+        updated = telemetry.update_store(blocks)
+    event_store.insert_store(blocks, updated)
 
 # -------------------------------
 # 🧑‍✈️ Панель диспетчера
@@ -63,29 +108,17 @@ st.markdown("## 🧑‍✈️ Панель диспетчера")
 
 col1, col2 = st.columns(2)
 if col1.button("🔌 Вимкнути всі"):
-    for blk in st.session_state.blocks.values():
-        blk["enabled"] = False
-        blk["status"] = "Вимкнено"
+    blocks.toggle_all(False)
 
 if col2.button("🧊 Перевірити ожеледь"):
-    for blk in st.session_state.blocks.values():
-        if blk["enabled"] and blk["temperature"] < -5 and blk["humidity"] > 80:
-            blk["status"] = "Ожеледь"
+    icing = blocks.enabled & (blocks.temperature < -5) & (blocks.humidity > 80)
+    blocks.set_status(icing, ICE)
 
 # -------------------------------
 # 📋 Таблиця параметрів
 # -------------------------------
 st.markdown("## 📋 Параметри ТП")
-df = pd.DataFrame([
-    {
-        "Блок": name,
-        "Температура": blk["temperature"],
-        "Вологість": blk["humidity"],
-        "Вітер": blk["wind"],
-        "Статус": blk["status"]
-    } for name, blk in st.session_state.blocks.items()
-    if blk["enabled"]
-])
+df = derived.get("df", (blocks.version,), lambda: blocks.to_frame(blocks.enabled))
 st.dataframe(df, use_container_width=True)
 
 # -------------------------------
@@ -99,10 +132,30 @@ if not df.empty:
 # 📝 Журнал подій
 # -------------------------------
 st.markdown("## 🗂 Журнал подій")
-log_df = pd.DataFrame(st.session_state.events)
+with st.expander("🔎 Фільтр журналу", expanded=True):
+    fcol1, fcol2, fcol3 = st.columns(3)
+    filter_blocks = fcol1.multiselect("Блоки", blocks.names)
+    filter_statuses = fcol2.multiselect("Статуси", STATUSES)
+    filter_hours = fcol3.number_input("За останні, год (0 — весь час)", min_value=0.0, value=6.0, step=1.0)
+filter_since = time.time() - filter_hours * 3600 if filter_hours else None
+
+# Запит іде в індексовану SQLite — уся історія в пам'ять не завантажується
+log_df = event_store.query(blocks=filter_blocks, statuses=filter_statuses, since=filter_since, limit=1000)
 if not log_df.empty:
-    st.dataframe(log_df.tail(10), use_container_width=True)
-    st.download_button("⬇️ Завантажити журнал CSV", log_df.to_csv(index=False).encode("utf-8"), file_name="events.csv")
+    st.caption(f"Показано {len(log_df)} найновіших подій з бази (до 1000)")
+    st.dataframe(log_df, use_container_width=True)
+    compression, ext, mime = FORMATS[st.selectbox("Формат експорту", available_formats())]
+    st.download_button(
+        "⬇️ Завантажити журнал CSV",
+        lambda: export_csv(
+            event_store.query(blocks=filter_blocks, statuses=filter_statuses, since=filter_since, limit=None),
+            compression,
+        ),
+        file_name=f"events{ext}",
+        mime=mime
+    )
+else:
+    st.info("Немає подій за обраним фільтром.")
 
 # -------------------------------
 # ⚙️ Симуляція подій
@@ -117,13 +170,80 @@ event_steps = {
 selected_event = st.selectbox("Оберіть подію", list(event_steps.keys()))
 
 if st.button("▶️ Анімувати подію"):
-    steps = event_steps[selected_event]
-    prog = st.progress(0)
-    for i, step in enumerate(steps):
-        st.write(f"**Крок {i+1}/{len(steps)}:** {step}")
-        time.sleep(0.7)
-        prog.progress((i+1)/len(steps))
-    st.success("✅ Симуляцію завершено")
+    st.session_state.player.start(event_steps[selected_event])
+play(st.session_state.player, show_progress=True)
+
+# -------------------------------
+# ⚡ Масова дискретно-подійна симуляція
+# -------------------------------
+with st.expander("⚡ Масова симуляція сценаріїв (DES)"):
+    dcol1, dcol2, dcol3 = st.columns(3)
+    des_scenario = dcol1.selectbox("Сценарій", list(SCENARIOS))
+    des_count = dcol2.number_input("Одночасних сценаріїв", min_value=1, max_value=100_000, value=1000, step=100)
+    des_spread = dcol3.number_input("Розкид стартів, с", min_value=0.0, max_value=3600.0, value=60.0, step=10.0)
+    des_to_log = st.checkbox("Записати кроки в журнал сценаріїв")
+    if st.button("⚡ Прогнати симуляцію"):
+        sim = EventSimulator(seed=telemetry.seed)
+        targets = [blocks.names[i % len(blocks)] for i in range(des_count)]
+        started = time.perf_counter()
+        sim.start_many(des_scenario, targets, spread=des_spread)
+        processed = sim.run()
+        wall = time.perf_counter() - started
+        trace = sim.trace()
+        st.write(
+            f"Оброблено {processed} кроків; модельний час {sim.now:.1f} с, "
+            f"реальний {wall:.3f} с — у {sim.now / max(wall, 1e-9):,.0f}× швидше за реальний час"
+        )
+        finished = trace.groupby("Запуск")["Час, с"].agg(["min", "max"])
+        st.dataframe(
+            trace.groupby("Крок", sort=False)["Час, с"].agg(["count", "min", "max"]),
+            use_container_width=True,
+        )
+        st.caption(f"Середня тривалість сценарію: {(finished['max'] - finished['min']).mean():.2f} с")
+        if des_to_log:
+            # Окрема таблиця: кроки не змішуються з подіями статусів у журналі вище
+            event_store.insert_steps(sim.event_rows())
+    steps_df = event_store.query_steps(since=filter_since, limit=1000)
+    if not steps_df.empty:
+        st.markdown("**Журнал сценаріїв** (до 1000 найновіших кроків)")
+        st.dataframe(steps_df, use_container_width=True, hide_index=True)
+
+with st.expander("🎲 Ризик ожеледі й поривів за сезон (Монте-Карло)"):
+    mcol1, mcol2, mcol3, mcol4 = st.columns(4)
+    mc_trials = mcol1.number_input("Сезонів", min_value=100, max_value=1_000_000, value=20_000, step=1000)
+    mc_ticks = mcol2.number_input("Замірів за сезон", min_value=1, max_value=10_000, value=90, step=10)
+    mc_blocks = mcol3.number_input("Блоків у фідері", min_value=1, max_value=1000, value=min(len(blocks), 1000), step=1)
+    mc_workers = mcol4.number_input("Процесів", min_value=1, max_value=64, value=4, step=1)
+    st.caption(
+        "Діапазони генератора: "
+        + ", ".join(
+            f"{label} {low:g}…{high:g}"
+            for label, (low, high) in zip(("температура", "вологість", "вітер"), telemetry.ranges.values())
+        )
+    )
+    if st.button("🎲 Оцінити ризик"):
+        progress = st.progress(0.0)
+        metrics = st.empty()
+        convergence = st.empty()
+        started = time.perf_counter()
+        for estimate in montecarlo.run(
+            mc_trials, mc_blocks, mc_ticks, seed=telemetry.seed, workers=mc_workers, **telemetry.ranges
+        ):
+            progress.progress(estimate.trials / mc_trials)
+            with metrics.container():
+                rcol1, rcol2, rcol3 = st.columns(3)
+                rcol1.metric("P(Ожеледь)", f"{estimate.p_ice:.4f}", f"±{estimate.half_width(estimate.p_ice):.4f}", delta_color="off")
+                rcol2.metric("P(Порив)", f"{estimate.p_gust:.4f}", f"±{estimate.half_width(estimate.p_gust):.4f}", delta_color="off")
+                rcol3.metric("P(будь-яка)", f"{estimate.p_any:.4f}", f"±{estimate.half_width(estimate.p_any):.4f}", delta_color="off")
+            convergence.line_chart(
+                pd.DataFrame(estimate.convergence).set_index("Сезонів")[["P(Ожеледь)", "P(Порив)", "P(будь-яка)"]]
+            )
+        st.caption(f"{estimate.trials} сезонів за {time.perf_counter() - started:.2f} с")
+        hcol1, hcol2 = st.columns(2)
+        hcol1.markdown("**Замірів з ожеледдю за сезон**")
+        hcol1.bar_chart(pd.Series(estimate.values("ice")).value_counts().sort_index())
+        hcol2.markdown("**Замір першої ожеледі**")
+        hcol2.bar_chart(pd.Series(estimate.values("first_ice")).value_counts().sort_index())
 
 # -------------------------------
 # 🕸 Граф мережі
@@ -137,16 +257,27 @@ status_colors = {
     "Вимкнено": "gray"
 }
 
-nodes = [
-    Node(id="Диспетчер", label="Диспетчер", size=25, color="lightgray"),
-    Node(id="GSM", label="GSM", size=20, color="lightblue")
-]
-edges = [Edge(source="Диспетчер", target="GSM")]
+node_ids = network.ids
+node_labels = network.labels()
+
+
+def build_topology():
+    # Повна топологія потрібна фронтенду лише раз; далі він отримує тільки зміни статусів
+    layout = network.layout() or cached_layout(network.key, network.edge_names())
+    return {
+        "nodes": node_ids,
+        "x": [layout[node][0] for node in node_ids],
+        "y": [layout[node][1] for node in node_ids],
+        "edges": network.edges.tolist(),
+        "size": [{"Диспетчер": 25, "GSM": 20, "ПС": 20}.get(label, 16) for label in node_labels],
+    }
 
-for tp, blk in st.session_state.blocks.items():
-    color = status_colors.get(blk["status"], "green") if blk["enabled"] else "gray"
-    nodes.append(Node(id=tp, label=tp, color=color))
-    edges.append(Edge(source="GSM", target=tp))
 
-config = Config(width=800, height=500, directed=False, physics=True, hierarchical=False)
-agraph(nodes=nodes, edges=edges, config=config)
+node_statuses = np.array(node_labels, dtype=object)
+node_statuses[network.block_nodes] = np.asarray(STATUSES)[np.where(blocks.enabled, blocks.status, OFF)]
+network_graph(
+    network.key,
+    build_topology,
+    node_statuses,
+    {**status_colors, "Диспетчер": "lightgray", "GSM": "lightblue", "ПС": "khaki"},
+)
@@ -2,13 +2,16 @@
 import streamlit as st
 import random
 import pandas as pd
-import time
 from datetime import datetime
 from streamlit_agraph import agraph, Node, Edge, Config
 
+from graph_layout import cached_layout, topology_key
+from scenario_player import ScenarioPlayer, play
+
 st.set_page_config(layout="wide")
 st.title("🔌 Симулятор мережі електропередач із диспетчерською панеллю та графом")
 
+
 # -------------------------------
 # Ініціалізація блоків
 # -------------------------------
@@ -22,6 +25,8 @@ if "blocks" not in st.session_state:
             "status": "Норма"
         } for i in range(1, 5)
     }
+if "player" not in st.session_state:
+    st.session_state.player = ScenarioPlayer(interval=0.7)
 
 # -------------------------------
 # Симуляція даних
@@ -88,13 +93,8 @@ event_steps = {
 selected_event = st.selectbox("Оберіть подію", list(event_steps.keys()))
 
 if st.button("▶️ Анімувати подію"):
-    steps = event_steps[selected_event]
-    prog = st.progress(0)
-    for i, step in enumerate(steps):
-        st.write(f"**Крок {i+1}/{len(steps)}:** {step}")
-        time.sleep(0.7)
-        prog.progress((i+1)/len(steps))
-    st.success("✅ Симуляцію завершено")
+    st.session_state.player.start(event_steps[selected_event])
+play(st.session_state.player, show_progress=True)
 
 # -------------------------------
 # 🕸 Граф мережі
@@ -108,16 +108,22 @@ status_colors = {
     "Вимкнено": "gray"
 }
 
+topology = [("Диспетчер", "GSM")] + [("GSM", tp) for tp in st.session_state.blocks]
+layout = cached_layout(topology_key(topology), topology)
+
 nodes = [
     Node(id="Диспетчер", label="Диспетчер", size=25, color="lightgray"),
     Node(id="GSM", label="GSM", size=20, color="lightblue")
 ]
-edges = [Edge(source="Диспетчер", target="GSM")]
+edges = [Edge(source=source, target=target) for source, target in topology]
 
 for tp in st.session_state.blocks:
     status = st.session_state.blocks[tp]["status"]
     nodes.append(Node(id=tp, label=tp, color=status_colors.get(status, "green")))
-    edges.append(Edge(source="GSM", target=tp))
 
-config = Config(width=800, height=500, directed=False, physics=True, hierarchical=False)
+for node in nodes:
+    node.x, node.y = layout[node.id]
+
+# Координати вже пораховані на сервері — фізика в браузері не потрібна
+config = Config(width=800, height=500, directed=False, physics=False, hierarchical=False)
 agraph(nodes=nodes, edges=edges, config=config)
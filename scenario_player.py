@@ -0,0 +1,67 @@
+import time
+
+import streamlit as st
+
+
+class ScenarioPlayer:
+    """Покрокове відтворення сценарію події без time.sleep у потоці скрипта.
+
+    Поточний крок обчислюється з часу старту, тому будь-який rerun (таймер
+    фрагмента чи дія користувача) показує правильний стан і нічого не чекає.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.steps = []
+        self.started_at = None
+        self.running = False
+
+    def start(self, steps):
+        self.steps = list(steps)
+        self.started_at = time.monotonic()
+        self.running = bool(self.steps)
+
+    def reset(self):
+        self.steps = []
+        self.started_at = None
+        self.running = False
+
+    @property
+    def position(self):
+        if self.started_at is None:
+            return 0
+        elapsed = time.monotonic() - self.started_at
+        return min(len(self.steps), 1 + int(elapsed / self.interval))
+
+    @property
+    def finished(self):
+        return bool(self.steps) and self.position == len(self.steps)
+
+
+def play(player, show_progress=False, done_message="✅ Симуляцію завершено"):
+    """Малює програвач у фрагменті, що сам себе перезапускає раз на player.interval.
+
+    Кроки показуються за таймером фрагмента — сесія не блокується на time.sleep.
+    Завершений сценарій видно до наступного rerun, далі панель порожня, як і
+    колись після циклу з time.sleep.
+    """
+
+    @st.fragment(run_every=player.interval if player.running else None)
+    def _panel():
+        if not player.steps:
+            return
+        position = player.position
+        total = len(player.steps)
+        for i, step in enumerate(player.steps[:position], 1):
+            st.write(f"**Крок {i}/{total}:** {step}")
+        if show_progress:
+            st.progress(position / total)
+        if player.finished:
+            st.success(done_message)
+            if player.running:
+                # Останній крок показано — зупиняємо таймер фрагмента
+                player.running = False
+                st.rerun()
+            player.reset()
+
+    _panel()
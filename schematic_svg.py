@@ -0,0 +1,54 @@
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from topology import BLOCK
+
+# Довша сторона полотна в одиницях viewBox; координати — цілі числа
+EXTENT = 10000
+# Найбільший радіус індикатора — частка EXTENT (на схемі з кількох вузлів)
+MAX_RADIUS = 0.025 * EXTENT
+# Підписи вузлів — лише поки їх не більше, далі назва видна у підказці
+LABEL_LIMIT = 200
+
+
+def render(network, layout, label_limit=LABEL_LIMIT):
+    """SVG-схема мережі за координатами топології.
+
+    Схема не залежить від статусів: кожен блок — <circle class="ind"> у
+    порядку network.block_ids, а колір задає клас, який фронтенд змінює лише
+    для блоків зі зміненим статусом. Тому схему можна будувати раз на
+    топологію, а ребра йдуть одним <path>, щоб тисячі вузлів не множили DOM.
+    """
+    xy = np.array([layout[node] for node in network.ids], dtype=float).reshape(-1, 2)
+    low = xy.min(axis=0)
+    span = max(float((xy.max(axis=0) - low).max()), 1.0)
+    xy = np.rint((xy - low) * (EXTENT / span)).astype(np.int64)
+    width, height = (xy.max(axis=0) + 1).tolist()
+    # Радіус — за середньою площею на вузол, щоб індикатори не злипались
+    radius = int(max(min(0.3 * (width * height / len(xy)) ** 0.5, MAX_RADIUS), 1))
+    pad = 3 * radius
+    labelled = len(network) <= label_limit
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{-pad} {-pad} {width + 2 * pad} {height + 2 * pad}" '
+        f'preserveAspectRatio="xMidYMid meet" font-size="{int(1.2 * radius)}">'
+    ]
+    if len(network.edges):
+        ends = xy[network.edges]
+        path = "".join(f"M{x1} {y1}L{x2} {y2}" for (x1, y1), (x2, y2) in ends.tolist())
+        parts.append(f'<path class="edge" d="{path}"/>')
+    is_block = network.kind == BLOCK
+    for i in np.flatnonzero(~is_block).tolist():
+        x, y = xy[i].tolist()
+        parts.append(
+            f'<rect class="hub k{network.kind[i]}" x="{x - radius}" y="{y - radius}" '
+            f'width="{2 * radius}" height="{2 * radius}"><title>{escape(network.ids[i])}</title></rect>'
+        )
+    for x, y in xy[network.block_nodes].tolist():
+        parts.append(f'<circle class="ind" cx="{x}" cy="{y}" r="{radius}"/>')
+    if labelled:
+        for i, (x, y) in enumerate(xy.tolist()):
+            parts.append(f'<text x="{x}" y="{y + 2 * radius + int(1.2 * radius)}">{escape(network.ids[i])}</text>')
+    parts.append("</svg>")
+    return "".join(parts)
@@ -0,0 +1,164 @@
+"""Безголовий запуск симуляції без Streamlit.
+
+    python -m simulator run --blocks 100000 --ticks 10000 --seed 42 --out run.parquet
+    python -m simulator run --topology network.json --ticks 1000
+    python -m simulator poll --blocks 10000 --cycles 20
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import gsm_channel
+import topology
+from block_store import STATUSES, BlockStore
+from telemetry import TelemetryGenerator
+
+COLUMNS = ("Тік", "Блок", "Статус", "Температура", "Вологість", "Вітер")
+
+
+# -------------------------------
+# Запис результатів
+# -------------------------------
+class ParquetOutput:
+    def __init__(self, path, block_names):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._names = pa.array(block_names)
+        self._statuses = pa.array(STATUSES)
+        self._writer = pq.ParquetWriter(path, pa.schema([
+            ("Тік", pa.int32()),
+            ("Блок", pa.dictionary(pa.int32(), pa.string())),
+            ("Статус", pa.dictionary(pa.int8(), pa.string())),
+            ("Температура", pa.float32()),
+            ("Вологість", pa.float32()),
+            ("Вітер", pa.float32()),
+        ]))
+
+    def write(self, tick, block, status, temperature, humidity, wind):
+        pa = self._pa
+        self._writer.write_table(pa.table([
+            pa.array(tick, pa.int32()),
+            pa.DictionaryArray.from_arrays(pa.array(block, pa.int32()), self._names),
+            pa.DictionaryArray.from_arrays(pa.array(status, pa.int8()), self._statuses),
+            pa.array(temperature, pa.float32()),
+            pa.array(humidity, pa.float32()),
+            pa.array(wind, pa.float32()),
+        ], names=list(COLUMNS)))
+
+    def close(self):
+        self._writer.close()
+
+
+class CsvOutput:
+    def __init__(self, path, block_names):
+        self.path = path
+        self._names = pd.Index(block_names)
+        self._header = True
+        open(path, "w").close()
+
+    def write(self, tick, block, status, temperature, humidity, wind):
+        pd.DataFrame({
+            "Тік": tick,
+            "Блок": pd.Categorical.from_codes(block, categories=self._names),
+            "Статус": pd.Categorical.from_codes(status, categories=STATUSES),
+            "Температура": temperature,
+            "Вологість": humidity,
+            "Вітер": wind,
+        }).to_csv(self.path, mode="a", header=self._header, index=False, encoding="utf-8")
+        self._header = False
+
+    def close(self):
+        pass
+
+
+def open_output(path, block_names):
+    if path is None:
+        return None
+    if path.endswith(".parquet"):
+        return ParquetOutput(path, block_names)
+    return CsvOutput(path, block_names)
+
+
+# -------------------------------
+# run: тіки симуляції
+# -------------------------------
+def run(blocks, ticks, seed=None, out=None, record="all", batch_rows=1_000_000, log=sys.stderr):
+    """Проганяє ticks оновлень для blocks блоків; повертає швидкість у тіках/с.
+
+    blocks — кількість блоків BB1..BBn або список імен (наприклад, блоки топології).
+
+    record: "all" — кожен увімкнений блок щотіку, "changes" — лише зміни статусу,
+    "none" — нічого не писати (чистий замір швидкості).
+    """
+    if isinstance(blocks, int):
+        blocks = [f"BB{i}" for i in range(1, blocks + 1)]
+    store = BlockStore(blocks)
+    telemetry = TelemetryGenerator(seed)
+    output = open_output(out, store.names) if record != "none" else None
+    pending, pending_rows = [], 0
+
+    def flush():
+        nonlocal pending, pending_rows
+        if output is not None and pending:
+            output.write(*(np.concatenate(column) for column in zip(*pending)))
+        pending, pending_rows = [], 0
+
+    started = time.perf_counter()
+    report_every = max(ticks // 10, 1)
+    for tick in range(ticks):
+        previous = store.status.copy() if record == "changes" else None
+        idx = telemetry.update_store(store)
+        if output is not None:
+            if previous is not None:
+                idx = idx[store.status[idx] != previous[idx]]
+            pending.append((
+                np.full(len(idx), tick, dtype=np.int32), idx, store.status[idx],
+                store.temperature[idx], store.humidity[idx], store.wind[idx],
+            ))
+            pending_rows += len(idx)
+            if pending_rows >= batch_rows:
+                flush()
+        if (tick + 1) % report_every == 0:
+            elapsed = time.perf_counter() - started
+            print(f"тік {tick + 1}/{ticks}: {(tick + 1) / elapsed:,.1f} тіків/с", file=log)
+    flush()
+    if output is not None:
+        output.close()
+    elapsed = time.perf_counter() - started
+    return ticks / elapsed if elapsed else float("inf")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m simulator", description="Симулятор мережі без Streamlit")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="прогнати тіки оновлення блоків")
+    run_parser.add_argument("--blocks", type=int, default=1000)
+    run_parser.add_argument("--topology", default=None, help="файл топології (.json, .csv, .graphml) замість --blocks")
+    run_parser.add_argument("--ticks", type=int, default=100)
+    run_parser.add_argument("--seed", type=int, default=None)
+    run_parser.add_argument("--out", default=None, help="файл .parquet або .csv")
+    run_parser.add_argument("--record", choices=["all", "changes", "none"], default="all")
+
+    poll_parser = commands.add_parser("poll", help="час циклу опитування через модель GSM-каналу")
+    gsm_channel.add_arguments(poll_parser)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        record = args.record if args.out else "none"
+        blocks = topology.load(args.topology).block_ids if args.topology else args.blocks
+        n_blocks = len(blocks) if args.topology else blocks
+        rate = run(blocks, args.ticks, args.seed, args.out, record)
+        print(f"{n_blocks} блоків × {args.ticks} тіків: {rate:,.1f} тіків/с ({rate * n_blocks:,.0f} блоків/с)")
+    elif args.command == "poll":
+        result = gsm_channel.report(gsm_channel.channel_from_args(args), args.blocks, args.cycles, args.seed)
+        print(gsm_channel.format_report(result))
+
+
+if __name__ == "__main__":
+    main()
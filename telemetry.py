@@ -0,0 +1,55 @@
+import os
+
+import numpy as np
+
+# -------------------------------
+# Діапазони вимірювань (як у обробниках "🔁 Оновити")
+# -------------------------------
+TEMPERATURE_RANGE = (-15, 10)
+HUMIDITY_RANGE    = (50, 100)
+WIND_RANGE        = (0, 40)
+
+# Змінна середовища для відтворюваних запусків і бенчмарків
+SEED_ENV = "SIMULATOR_SEED"
+
+
+def seed_from_env(default=None):
+    value = os.environ.get(SEED_ENV, "").strip()
+    return int(value) if value else default
+
+
+class TelemetryGenerator:
+    """Пакетне джерело телеметрії на numpy.random.Generator.
+
+    Один виклик sample(n) дає температуру, вологість і вітер для n блоків,
+    округлені до 0.1 — як round(random.uniform(...), 1) у старих циклах.
+    Однаковий seed і однакова послідовність n дають ті самі значення біт у біт.
+    """
+
+    def __init__(self, seed=None, temperature=TEMPERATURE_RANGE, humidity=HUMIDITY_RANGE, wind=WIND_RANGE):
+        ranges = np.array([temperature, humidity, wind], dtype=np.float64)
+        self._low = ranges[:, :1]
+        self._high = ranges[:, 1:]
+        self.reseed(seed)
+
+    @property
+    def ranges(self):
+        """Діапазони генератора як ключові аргументи (temperature, humidity, wind)."""
+        low, high = self._low[:, 0].tolist(), self._high[:, 0].tolist()
+        return dict(zip(("temperature", "humidity", "wind"), zip(low, high)))
+
+    def reseed(self, seed):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+
+    def sample(self, n):
+        values = self.rng.uniform(self._low, self._high, size=(3, n))
+        np.round(values, 1, out=values)
+        temperature, humidity, wind = values
+        return temperature, humidity, wind
+
+    def update_store(self, store):
+        """Оновлює всі увімкнені блоки BlockStore одним пакетом."""
+        idx = store.enabled_indices()
+        store.update_at(idx, *self.sample(len(idx)))
+        return idx
@@ -0,0 +1,86 @@
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from block_store import OFF, STATUSES
+from downsample import lttb, pixel_thin
+from history import METRICS
+
+# Імена наборів даних у специфікації: рядки передаються окремо від неї
+DATASET = "telemetry"
+COUNTS = "status_counts"
+# Ознаки рядків, що потрапляють на лінії та на діаграму розсіювання після проріджування
+LINES = "Лінії"
+SCATTER = "Розсіювання"
+
+
+def _line_rows(blocks, active, width):
+    """Блоки для ліній: LTTB уздовж порядку блоків, по width // 3 точок на показник.
+
+    Об'єднання по трьох показниках дає не більше width рядків, тож кожна
+    панель малює не більше точок, ніж має пікселів по ширині.
+    """
+    position = np.arange(len(active))
+    n_out = max(width // len(METRICS), 3)
+    picked = [lttb(position, getattr(blocks, column)[active], n_out)[0] for column in ("temperature", "humidity", "wind")]
+    return np.unique(np.concatenate(picked))
+
+
+def dataset(blocks, width):
+    """Набори даних для spec(): {DATASET: рядки ліній і розсіювання, COUNTS: кількість за статусами}.
+
+    У DATASET потрапляють лише увімкнені блоки, відібрані для ліній (ознака
+    LINES) або для розсіювання (ознака SCATTER) — не більше ~2 × width рядків
+    незалежно від кількості блоків. Стовпчики статусів рахуються на сервері.
+    """
+    active = np.flatnonzero(blocks.status != OFF)
+    lines = np.zeros(len(active), dtype=bool)
+    lines[_line_rows(blocks, active, width)] = True
+    scatter = np.zeros(len(active), dtype=bool)
+    scatter[pixel_thin(blocks.temperature[active], blocks.humidity[active], width, width // 2)] = True
+    rows = np.flatnonzero(lines | scatter)
+    idx = active[rows]
+    frame = pd.DataFrame({
+        "Блок": np.asarray(blocks.names, dtype=object)[idx],
+        "Температура": blocks.temperature[idx],
+        "Вологість": blocks.humidity[idx],
+        "Вітер": blocks.wind[idx],
+        "Статус": np.asarray(STATUSES, dtype=object)[blocks.status[idx]],
+        LINES: lines[rows],
+        SCATTER: scatter[rows],
+    })
+    counts = blocks.status_counts().reset_index()
+    return {DATASET: frame, COUNTS: counts}
+
+
+def spec(width, palette):
+    """Vega-Lite специфікація без даних: рядки dataset() приходять як набори DATASET і COUNTS.
+
+    Специфікація залежить лише від ширини й палітри, тож її можна кешувати,
+    а на rerun змінюються тільки дані.
+    """
+    base = alt.Chart()
+    color = alt.Color(
+        "Статус:N",
+        scale=alt.Scale(domain=list(palette), range=list(palette.values())),
+        legend=alt.Legend(orient="top"),
+    )
+    lines = base.transform_filter(alt.datum[LINES]).transform_fold(list(METRICS), as_=["Показник", "Значення"]).mark_line(point=True).encode(
+        x=alt.X("Блок:N", sort=None, axis=alt.Axis(labelOverlap=True)),
+        y=alt.Y("Значення:Q", title=None),
+        row=alt.Row("Показник:N", sort=list(METRICS), title=None),
+        tooltip=["Блок:N", "Показник:N", "Значення:Q"],
+    ).properties(width=width, height=160).resolve_scale(y="independent")
+    bars = alt.Chart(alt.Data(name=COUNTS)).mark_bar().encode(
+        x=alt.X("Статус:N", sort=list(palette), title=None),
+        y=alt.Y("Кількість:Q"),
+        color=color,
+        tooltip=["Статус:N", "Кількість:Q"],
+    ).properties(width=width // 4, height=width // 2, title="Стан блоків")
+    scatter = base.transform_filter(alt.datum[SCATTER]).mark_circle(size=80).encode(
+        x="Температура:Q",
+        y="Вологість:Q",
+        color=color,
+        tooltip=["Блок:N", "Статус:N", "Температура:Q", "Вологість:Q"],
+    ).properties(width=width * 3 // 4 - 40, height=width // 2, title="Темп vs Вологість").interactive()
+    return alt.vconcat(lines, alt.hconcat(bars, scatter), data=alt.Data(name=DATASET)).to_dict()
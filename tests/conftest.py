@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Модулі лежать у корені репозиторію поруч зі скриптами Streamlit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,55 @@
+import itertools
+
+import numpy as np
+
+from block_store import OFF, STATUS_OFF, STATUSES, BlockStore, classify
+
+
+def block_update(enabled, temperature, humidity, wind):
+    # Правила Block.update / update_status зі скриптів-варіантів
+    if not enabled:
+        return STATUS_OFF
+    if temperature < -5 and humidity > 80:
+        return "Ожеледь"
+    elif wind > 25:
+        return "Порив"
+    return "Норма"
+
+
+def around(value):
+    return (np.nextafter(value, -np.inf), value, np.nextafter(value, np.inf))
+
+
+def test_classify_matches_block_update_at_boundaries():
+    grid = np.array(list(itertools.product(around(-5.0), around(80.0), around(25.0))))
+    codes = classify(grid[:, 0], grid[:, 1], grid[:, 2])
+    assert [STATUSES[code] for code in codes] == [block_update(True, *row) for row in grid.tolist()]
+
+
+def test_classify_matches_block_update_on_random_readings():
+    rng = np.random.default_rng(1)
+    temperature = rng.uniform(-15, 10, 10_000)
+    humidity = rng.uniform(60, 100, 10_000)
+    wind = rng.uniform(0, 40, 10_000)
+    codes = classify(temperature, humidity, wind)
+    expected = [block_update(True, *row) for row in zip(temperature, humidity, wind)]
+    assert [STATUSES[code] for code in codes] == expected
+
+
+def test_update_skips_disabled_blocks():
+    store = BlockStore(["B1", "B2", "B3"])
+    store.toggle("B2", False)
+    store.update(np.array([-6.0, -6.0, 0.0]), np.array([81.0, 81.0, 50.0]), np.array([30.0, 30.0, 30.0]))
+    readings = [(b.temperature, b.humidity, b.wind) for b in store.values()]
+    assert [b.status for b in store.values()] == [
+        block_update(b.enabled, *reading) for b, reading in zip(store.values(), readings)
+    ]
+    assert store.status[store.index["B2"]] == OFF
+    assert store["B2"].temperature == 0.0
+
+
+def test_block_view_update_uses_same_rules():
+    store = BlockStore(["B1"])
+    for reading in itertools.product(around(-5.0), around(80.0), around(25.0)):
+        store["B1"].update(*reading)
+        assert store["B1"].status == block_update(True, *reading)
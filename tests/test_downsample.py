@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from downsample import DOWNSAMPLERS, lttb, minmax, pixel_thin
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(4)
+    x = np.arange("2024-01-01T00:00:00", "2024-01-02T00:00:00", np.timedelta64(5, "s"), dtype="datetime64[ms]")
+    y = np.cumsum(rng.normal(size=len(x)))
+    y[1234] = 500.0
+    y[5678] = -500.0
+    return x, y
+
+
+@pytest.mark.parametrize("method", list(DOWNSAMPLERS.values()))
+def test_short_series_is_returned_as_is(method):
+    x, y = np.arange(10), np.linspace(0, 1, 10)
+    out_x, out_y = method(x, y, 100)
+    np.testing.assert_array_equal(out_x, x)
+    np.testing.assert_array_equal(out_y, y)
+
+
+def test_lttb_keeps_ends_and_size(series):
+    x, y = series
+    out_x, out_y = lttb(x, y, 500)
+    assert len(out_x) == 500
+    assert out_x[0] == x[0] and out_x[-1] == x[-1]
+    assert (np.diff(out_x.astype(np.int64)) > 0).all()
+    # Вибрані точки — справжні точки ряду
+    np.testing.assert_array_equal(out_y, y[np.searchsorted(x, out_x)])
+
+
+def test_lttb_drops_nan(series):
+    x, y = series
+    y = y.copy()
+    y[::3] = np.nan
+    out_x, out_y = lttb(x, y, 300)
+    assert len(out_x) == 300
+    assert not np.isnan(out_y).any()
+
+
+@pytest.mark.parametrize("method", [lttb, minmax])
+def test_peaks_survive(series, method):
+    x, y = series
+    _, out_y = method(x, y, 400)
+    assert out_y.max() == 500.0
+    assert out_y.min() == -500.0
+
+
+def test_minmax_stays_within_budget_and_in_order(series):
+    x, y = series
+    out_x, out_y = minmax(x, y, 400)
+    assert len(out_x) <= 400
+    assert (np.diff(out_x.astype(np.int64)) > 0).all()
+    # Кожен кошик дає свої мінімум і максимум
+    size = -(-len(y) // 200)
+    for start in range(0, len(y), size * 37):
+        bucket = y[start:start + size]
+        assert bucket.max() in out_y and bucket.min() in out_y
+
+
+def test_pixel_thin_caps_at_width():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=100_000), rng.normal(size=100_000)
+    idx = pixel_thin(x, y, 800, 400)
+    assert len(idx) == 800
+    assert (np.diff(idx) > 0).all()
+
+
+def test_pixel_thin_one_point_per_cell():
+    # 20 скупчень по 50 однакових точок: лишається по одній точці на скупчення
+    centers = np.arange(20) * 100.0
+    x = np.repeat(centers, 50)
+    y = np.repeat(centers[::-1], 50)
+    idx = pixel_thin(x, y, 200, 200, point=10)
+    assert len(idx) == 20
+    assert sorted(set(x[idx])) == sorted(centers)
+
+
+def test_pixel_thin_small_input_and_constant_values():
+    assert pixel_thin(np.arange(5), np.arange(5), 800, 400).tolist() == [0, 1, 2, 3, 4]
+    flat = np.ones(5000)
+    assert len(pixel_thin(flat, flat, 800, 400)) == 1
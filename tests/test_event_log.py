@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from event_log import EventLog
+
+NAMES = ["B1", "B2", "B3"]
+
+
+def append(log, values):
+    # Значення рядка кладемо у «Вітер», щоб перевіряти порядок після кільця
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    log.append_batch(np.datetime64("2024-01-01T00:00:00"), np.arange(n) % len(NAMES),
+                     np.zeros(n, dtype=np.int8), values, values, values)
+
+
+def winds(log, last=None):
+    return log.columns(last)["Вітер"].tolist()
+
+
+def test_wraparound_keeps_newest_rows_in_order():
+    log = EventLog(NAMES, capacity=5)
+    append(log, [1, 2, 3])
+    append(log, [4, 5, 6, 7])
+    assert len(log) == 5
+    assert log.total == 7
+    assert winds(log) == [3, 4, 5, 6, 7]
+    assert winds(log, last=2) == [6, 7]
+    append(log, [8])
+    assert winds(log) == [4, 5, 6, 7, 8]
+
+
+def test_batch_larger_than_capacity_keeps_tail():
+    log = EventLog(NAMES, capacity=4)
+    append(log, range(10))
+    assert winds(log) == [6, 7, 8, 9]
+    assert log.total == 10
+
+
+def test_columns_are_views_without_copy():
+    log = EventLog(NAMES, capacity=4)
+    append(log, range(6))
+    assert np.shares_memory(log.columns()["Вітер"], log.wind)
+
+
+def test_to_frame_decodes_categories():
+    log = EventLog(NAMES, capacity=4)
+    append(log, range(6))
+    frame = log.to_frame()
+    assert frame["Блок"].tolist() == ["B3", "B1", "B2", "B3"]
+    assert frame["Статус"].tolist() == ["Норма"] * 4
+
+
+def test_resize_shrink_keeps_newest_rows():
+    log = EventLog(NAMES, capacity=5)
+    append(log, range(7))
+    version = log.version
+    log.resize(3)
+    assert log.capacity == 3
+    assert winds(log) == [4, 5, 6]
+    assert log.total == 7
+    assert log.version > version
+    append(log, [7])
+    assert winds(log) == [5, 6, 7]
+
+
+def test_resize_grow_keeps_all_rows():
+    log = EventLog(NAMES, capacity=3)
+    append(log, range(5))
+    log.resize(6)
+    assert winds(log) == [2, 3, 4]
+    append(log, [5, 6, 7, 8])
+    assert winds(log) == [3, 4, 5, 6, 7, 8]
+    assert log.total == 9
+
+
+def test_clear_and_invalid_capacity():
+    log = EventLog(NAMES, capacity=3)
+    append(log, range(2))
+    log.clear()
+    assert len(log) == 0
+    assert winds(log) == []
+    with pytest.raises(ValueError):
+        EventLog(NAMES, capacity=0)
+
+
+def test_append_blocks_records_block_objects():
+    class Block:
+        def __init__(self, name, status, reading):
+            self.name, self.status = name, status
+            self.temperature = self.humidity = self.wind = reading
+
+    log = EventLog(NAMES, capacity=4)
+    version = log.version
+    log.append_blocks([Block("B3", "Ожеледь", 1.0), Block("B1", "Порив", 2.0)], time="2024-01-01T12:00:00")
+    frame = log.to_frame()
+    assert frame["Блок"].tolist() == ["B3", "B1"]
+    assert frame["Статус"].tolist() == ["Ожеледь", "Порив"]
+    assert frame["Вітер"].tolist() == [1.0, 2.0]
+    assert frame["Час"].tolist() == [np.datetime64("2024-01-01T12:00:00")] * 2
+    assert log.version > version
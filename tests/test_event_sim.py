@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from event_sim import BLOCK, DISPATCHER, GSM, SCENARIOS, EventSimulator
+
+
+def party(text):
+    # Учасник за назвою в підписі кроку: сенсори — частина виносного блока
+    if "испетчер" in text:
+        return DISPATCHER
+    if "GSM" in text:
+        return GSM
+    return BLOCK
+
+
+@pytest.mark.parametrize("name", list(SCENARIOS))
+def test_endpoints_match_labels(name):
+    for label, src, dst, _ in SCENARIOS[name]:
+        if "→" in label:
+            left, right = label.split(". ", 1)[1].split(" → ")
+            assert (src, dst) == (party(left), party(right)), label
+
+
+@pytest.mark.parametrize("name", list(SCENARIOS))
+def test_messages_chain_through_gsm(name):
+    steps = SCENARIOS[name]
+    for (_, _, previous, _), (label, src, dst, _) in zip(steps, steps[1:]):
+        assert src == previous, label
+    for label, src, dst, _ in steps:
+        assert {src, dst} != {DISPATCHER, BLOCK}, label
+    assert steps[-1][2] == DISPATCHER
+
+
+def test_steps_are_delivered_in_time_order():
+    sim = EventSimulator(seed=3)
+    sim.start_many("Поява льоду", [f"TP{i}" for i in range(200)], spread=10.0)
+    sim.start("Самотестування", "TP0", at=1.0)
+    assert sim.run() == 200 * len(SCENARIOS["Поява льоду"]) + len(SCENARIOS["Самотестування"])
+    trace = sim.trace()
+    assert trace["Час, с"].is_monotonic_increasing
+    assert sim.now == trace["Час, с"].iloc[-1]
+    for _, run in trace.groupby("Запуск"):
+        steps = SCENARIOS[run["Сценарій"].iloc[0]]
+        assert run["Крок"].tolist() == [step[0] for step in steps]
+    row = trace[trace["Крок"] == "Б. GSM → блок виносний"].iloc[0]
+    assert (row["Від"], row["Кому"]) == (GSM, row["Блок"])
+
+
+def test_run_until_stops_at_the_horizon():
+    sim = EventSimulator(seed=1)
+    sim.start_many("Коротке замикання", ["TP1", "TP2", "TP3"])
+    sim.run(until=1.0)
+    assert sim.now == 1.0
+    assert (sim.trace()["Час, с"] <= 1.0).all()
+    assert len(sim) > 0
+    sim.run()
+    assert len(sim) == 0
+    assert len(sim.trace()) == 3 * len(SCENARIOS["Коротке замикання"])
+
+
+def test_same_seed_gives_same_trace():
+    def trace():
+        sim = EventSimulator(seed=9)
+        sim.start_many("Обрив проводів", ["TP1", "TP2"], spread=5.0)
+        sim.run()
+        return sim.trace()
+
+    assert trace().equals(trace())
+
+
+def test_event_rows_end_at_now_and_never_in_future():
+    sim = EventSimulator(seed=2)
+    sim.start_many("Опитування сенсорів", ["TP1", "TP2"], spread=3.0)
+    sim.run()
+    rows = list(sim.event_rows(end=1_000_000.0))
+    times = np.array([row[0] for row in rows])
+    assert times.max() == pytest.approx(1_000_000.0)
+    assert (times <= 1_000_000.0).all()
+    assert {row[3] for row in rows} == {step[0] for step in SCENARIOS["Опитування сенсорів"]}
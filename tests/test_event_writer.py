@@ -0,0 +1,90 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from event_writer import EventWriter
+
+
+@pytest.fixture(autouse=True)
+def _no_atexit(monkeypatch):
+    # Кожен тест закриває writer сам; atexit не має тримати об'єкти до кінця сесії
+    monkeypatch.setattr("event_writer.atexit.register", lambda func: None)
+
+
+def frame(tick, n=2, blocks=("B1", "B2")):
+    return pd.DataFrame({
+        "Тік": [tick] * n,
+        "Блок": pd.Categorical([blocks[i % len(blocks)] for i in range(n)], categories=list(blocks)),
+        "Вітер": [float(tick)] * n,
+    })
+
+
+def test_submit_drops_repeated_and_older_ticks(tmp_path):
+    writer = EventWriter(str(tmp_path / "events.csv"), flush_interval=60)
+    assert writer.submit(1, frame(1))
+    assert not writer.submit(1, frame(1))
+    assert not writer.submit(0, frame(0))
+    assert writer.submit(2, frame(2))
+    # Лічильник тіків окремий для кожного джерела
+    assert writer.submit(1, frame(1), source="other")
+    writer.close()
+    written = pd.read_csv(tmp_path / "events.csv")
+    assert written["Тік"].tolist() == [1, 1, 2, 2, 1, 1]
+    assert writer.rows_written == 6
+
+
+def test_empty_frame_advances_tick_without_writing(tmp_path):
+    writer = EventWriter(str(tmp_path / "events.csv"), flush_interval=60)
+    assert writer.submit(1, frame(1).iloc[:0])
+    assert not writer.submit(1, frame(1))
+    writer.close()
+    assert not os.path.exists(tmp_path / "events.csv")
+
+
+def test_flushes_when_row_limit_is_reached(tmp_path):
+    writer = EventWriter(str(tmp_path / "events.csv"), flush_interval=60, flush_rows=4)
+    for tick in range(1, 4):
+        writer.submit(tick, frame(tick))
+    deadline = time.monotonic() + 5
+    while writer.rows_written < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.rows_written == 4
+    writer.close()
+    assert writer.rows_written == 6
+
+
+def test_parquet_parts_have_matching_schema(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    writer = EventWriter(path, flush_interval=60, flush_rows=1)
+    writer.submit(1, frame(1, blocks=("B1", "B2")))
+    writer.submit(2, frame(2, n=3, blocks=[f"B{i}" for i in range(300)]))
+    writer.close()
+    parts = sorted(name for name in os.listdir(path) if not name.startswith("."))
+    assert len(parts) == 2
+    written = pd.read_parquet(path)
+    assert sorted(written["Тік"].tolist()) == [1, 1, 2, 2, 2]
+    assert writer.errors == 0
+
+
+def test_failed_flush_is_counted_and_writer_keeps_running(tmp_path, monkeypatch):
+    writer = EventWriter(str(tmp_path / "events.csv"), flush_interval=60, flush_rows=1)
+    calls = []
+
+    def write(batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise OSError("диск заповнено")
+        batch.to_csv(tmp_path / "events.csv", index=False)
+
+    monkeypatch.setattr(writer._sink, "write", write)
+    writer.submit(1, frame(1))
+    deadline = time.monotonic() + 5
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.submit(2, frame(2))
+    writer.close()
+    assert writer.errors == 1
+    assert writer.rows_written == 2
+    assert pd.read_csv(tmp_path / "events.csv")["Тік"].tolist() == [2, 2]
@@ -0,0 +1,43 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from fault_index import SubtreeIndex
+from topology_generator import generate
+
+
+@pytest.fixture(params=["radial", "ring"])
+def network(request):
+    return generate(request.param, substations=5, blocks=30, depth=4, branching=3, seed=7)
+
+
+def test_downstream_matches_descendants(network):
+    root = network.roots[0]
+    index = SubtreeIndex(network.graph, root)
+    # На кільцевій мережі живлення — по дереву BFS від кореня
+    tree = nx.bfs_tree(network.graph, root)
+    assert len(index) == len(network)
+    for node in network.ids:
+        assert set(index.downstream(node)) == nx.descendants(tree, node)
+        assert set(index.downstream(node, include_self=True)) == nx.descendants(tree, node) | {node}
+
+
+def test_is_downstream_matches_descendants(network):
+    root = network.roots[0]
+    index = SubtreeIndex(network.graph, root)
+    tree = nx.bfs_tree(network.graph, root)
+    rng = np.random.default_rng(3)
+    for of in rng.choice(network.ids, 20, replace=False).tolist():
+        below = nx.descendants(tree, of)
+        for node in network.ids:
+            assert index.is_downstream(node, of) == (node in below)
+
+
+def test_deenergized_is_union_of_subtrees(network):
+    root = network.roots[0]
+    index = SubtreeIndex(network.graph, root)
+    tree = nx.bfs_tree(network.graph, root)
+    faults = ["PS2", network.block_ids[0], network.block_ids[40], "PS2"]
+    expected = set().union(*(nx.descendants(tree, node) for node in faults))
+    assert set(index.order[index.deenergized(faults)]) == expected
+    assert not index.deenergized([]).any()
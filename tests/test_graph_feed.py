@@ -0,0 +1,87 @@
+import numpy as np
+
+from graph_component import GraphFeed
+
+NODES = ["Диспетчер", "TP1", "TP2", "TP3"]
+
+
+class Frontend:
+    """Те саме рішення, що й у components/*/index.html: застосувати, пропустити чи просити resync."""
+
+    def __init__(self):
+        self.key = None
+        self.seq = None
+        self.statuses = {}
+        self.resync = None
+
+    def receive(self, message):
+        if "topology" in message:
+            self.key, self.seq = message["key"], message["seq"]
+            self.statuses = dict(message["statuses"])
+        elif message["key"] == self.key and message["base"] == self.seq:
+            self.statuses.update(message["statuses"])
+            self.seq = message["seq"]
+        elif message["seq"] != self.seq or message["key"] != self.key:
+            self.resync = (self.resync or 0) + 1
+
+
+def topology(calls):
+    def build():
+        calls.append(1)
+        return {"nodes": NODES}
+    return build
+
+
+def test_topology_is_sent_once_then_only_changes():
+    feed, calls = GraphFeed(), []
+    first = feed.message("k", topology(calls), ["Норма"] * 4)
+    assert first["topology"] == {"nodes": NODES}
+    assert first["statuses"] == dict.fromkeys(NODES, "Норма")
+    same = feed.message("k", topology(calls), ["Норма"] * 4)
+    assert "topology" not in same
+    assert same["statuses"] == {}
+    assert same["seq"] == same["base"] == first["seq"]
+    changed = feed.message("k", topology(calls), ["Норма", "Ожеледь", "Норма", "Вимкнено"])
+    assert changed["statuses"] == {"TP1": "Ожеледь", "TP3": "Вимкнено"}
+    assert (changed["base"], changed["seq"]) == (first["seq"], first["seq"] + 1)
+    assert len(calls) == 1
+
+
+def test_new_key_or_resync_token_sends_full_topology():
+    feed, calls = GraphFeed(), []
+    feed.message("k", topology(calls), ["Норма"] * 4)
+    assert "topology" in feed.message("k2", topology(calls), ["Норма"] * 4)
+    assert "topology" in feed.message("k2", topology(calls), ["Норма"] * 4, resync=1)
+    # Той самий токен повторно (наступні rerun) — знову лише зміни
+    assert "topology" not in feed.message("k2", topology(calls), ["Норма"] * 4, resync=1)
+    assert len(calls) == 3
+
+
+def test_longer_labels_are_not_truncated():
+    feed = GraphFeed()
+    feed.message("k", topology([]), np.array(["OK"] * 4))
+    message = feed.message("k", topology([]), np.array(["OK", "Ожеледь", "OK", "OK"]))
+    assert message["statuses"] == {"TP1": "Ожеледь"}
+    assert feed.message("k", topology([]), np.array(["OK", "Ожеледь", "OK", "OK"]))["statuses"] == {}
+
+
+def test_frontend_stays_in_sync_and_recovers_from_lost_message():
+    feed, frontend = GraphFeed(), Frontend()
+    rng = np.random.default_rng(0)
+    labels = np.array(["Норма", "Ожеледь", "Порив", "Вимкнено"], dtype=object)
+    statuses = labels[rng.integers(0, 4, len(NODES))]
+    frontend.receive(feed.message("k", topology([]), statuses))
+    for step in range(30):
+        statuses = statuses.copy()
+        statuses[rng.integers(0, len(NODES))] = labels[rng.integers(0, 4)]
+        message = feed.message("k", topology([]), statuses, frontend.resync)
+        if step == 10:
+            # Повідомлення загубилось (iframe перезавантажено): фронтенд помітить розрив seq
+            statuses[1] = "Ожеледь" if statuses[1] != "Ожеледь" else "Норма"
+            feed.message("k", topology([]), statuses, frontend.resync)
+            continue
+        frontend.receive(message)
+        if frontend.resync and "topology" not in message:
+            frontend.receive(feed.message("k", topology([]), statuses, frontend.resync))
+        assert frontend.statuses == dict(zip(NODES, statuses.tolist()))
+    assert frontend.resync == 1
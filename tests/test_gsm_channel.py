@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from gsm_channel import GsmChannel, report
+
+
+def exact(**kwargs):
+    # Без втрат і без розкиду затримки — час опитування рахується вручну
+    return GsmChannel(loss=0.0, latency_sigma=0.0, **kwargs)
+
+
+def test_single_poll_time_is_transmission_plus_latency():
+    channel = exact(bandwidth_bps=8000, latency_median=0.25, request_bytes=100, response_bytes=200)
+    latency, attempts, cycle_end = channel.poll_cycle(1, np.random.default_rng(0))
+    expected = 100 * 8 / 8000 + 0.25 + 200 * 8 / 8000 + 0.25
+    assert latency[0] == pytest.approx(expected)
+    assert cycle_end == pytest.approx(expected)
+    assert attempts.tolist() == [1]
+
+
+def test_window_of_one_polls_blocks_back_to_back():
+    channel = exact(bandwidth_bps=8000, latency_median=0.25, request_bytes=100, response_bytes=200, window=1)
+    latency, _, cycle_end = channel.poll_cycle(10, np.random.default_rng(0))
+    np.testing.assert_allclose(latency, latency[0])
+    assert cycle_end == pytest.approx(10 * latency[0])
+
+
+def test_uplink_bandwidth_bounds_the_cycle():
+    channel = exact(bandwidth_bps=9600, latency_median=0.01, window=50, timeout=60.0)
+    n = 500
+    _, attempts, cycle_end = channel.poll_cycle(n, np.random.default_rng(0))
+    assert (attempts == 1).all()
+    assert cycle_end >= n * channel.response_bytes * 8 / channel.bandwidth_bps
+
+
+def test_queueing_beyond_timeout_causes_retries():
+    # 50 відповідей у черзі на 9600 біт/с — довше за timeout 5 с
+    channel = exact(bandwidth_bps=9600, latency_median=0.01, window=50, timeout=5.0)
+    _, attempts, _ = channel.poll_cycle(500, np.random.default_rng(0))
+    assert (attempts > 1).any()
+
+
+def test_lost_messages_are_retried_then_given_up():
+    channel = GsmChannel(loss=1.0, timeout=2.0, retries=3, window=5)
+    latency, attempts, cycle_end = channel.poll_cycle(8, np.random.default_rng(0))
+    assert np.isnan(latency).all()
+    assert (attempts == channel.retries + 1).all()
+    # Два «вікна» по 5 і 3 блоки, кожне — 4 спроби по timeout
+    assert cycle_end == pytest.approx(2 * 4 * 2.0)
+
+
+def test_report_is_reproducible_and_counts_failures():
+    channel = GsmChannel(loss=0.2, timeout=1.0, retries=1)
+    first = report(channel, 300, cycles=3, seed=11)
+    assert first == report(channel, 300, cycles=3, seed=11)
+    assert first["retried"] > 0
+    assert first["failed"] > 0
+    assert first["poll_p50"] <= first["poll_p99"] <= first["cycle_p99"]
@@ -0,0 +1,53 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from gsm_gateway import GatewayState, GatewayThread, run_fleet
+
+
+@pytest.fixture
+def gateway():
+    gateway = GatewayThread(0).start()
+    yield gateway
+    gateway.stop()
+
+
+def test_reserve_grows_state_and_keeps_reports():
+    state = GatewayState(2)
+    state.ingest(1, -3.0, 90.0, 5.0)
+    state.reserve(5)
+    state.reserve(3)
+    assert state.n_blocks == 5
+    assert state.reports.tolist() == [0, 1, 0, 0, 0]
+    state.ingest(4, 1.0, 50.0, 10.0)
+    idx, temperature, _, _ = state.snapshot()
+    assert idx.tolist() == [1, 4]
+    assert temperature.tolist() == [-3.0, 1.0]
+    # Менша топологія бачить лише свої блоки
+    assert state.snapshot(n_blocks=3)[0].tolist() == [1]
+
+
+@pytest.mark.parametrize("transport", ["udp", "tcp"])
+def test_fleet_reports_within_given_ranges(gateway, transport):
+    gateway.state.reserve(50)
+    ranges = {"temperature": (-2.0, -1.0), "humidity": (40.0, 45.0), "wind": (0.0, 35.0)}
+    stats = asyncio.run(run_fleet(
+        gateway.gateway.host, gateway.gateway.udp_port, gateway.gateway.tcp_port, 50,
+        interval=0.1, duration=0.5, transport=transport, connections=4, seed=1, **ranges,
+    ))
+    assert stats["sent"] > 0
+    idx, temperature, humidity, wind = gateway.state.snapshot()
+    assert len(idx) == 50
+    for values, (low, high) in zip((temperature, humidity, wind), ranges.values()):
+        assert np.all((values >= low - 0.05) & (values <= high + 0.05))
+
+
+def test_frames_for_unreserved_blocks_are_ignored(gateway):
+    gateway.state.reserve(10)
+    asyncio.run(run_fleet(
+        gateway.gateway.host, gateway.gateway.udp_port, gateway.gateway.tcp_port, 20,
+        interval=0.1, duration=0.3, connections=2, seed=1,
+    ))
+    assert gateway.state.n_blocks == 10
+    assert (gateway.state.reports > 0).sum() == 10
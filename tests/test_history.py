@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from history import BUDGET_ENV, DEFAULT_CAPACITY, MIN_CAPACITY, TelemetryHistory, budget_from_env, capacity_for
+
+
+def test_capacity_scales_with_block_count():
+    assert capacity_for(7) == DEFAULT_CAPACITY
+    assert capacity_for(50_000, budget_mb=32) == 55
+    assert capacity_for(200_000, budget_mb=32) == 13
+    assert capacity_for(10_000_000, budget_mb=32) == MIN_CAPACITY
+    # Історія вкладається в бюджет, поки не впирається в MIN_CAPACITY
+    for n_blocks in (1_000, 50_000, 200_000):
+        assert 3 * n_blocks * 4 * capacity_for(n_blocks, budget_mb=32) <= 32 * 2**20
+
+
+def test_budget_from_env(monkeypatch):
+    monkeypatch.setenv(BUDGET_ENV, "128")
+    assert budget_from_env() == 128.0
+    monkeypatch.setenv(BUDGET_ENV, "")
+    assert budget_from_env(16) == 16
+
+
+def test_values_are_allocated_on_first_tick():
+    history = TelemetryHistory(1_000, capacity=20)
+    assert history.values is None
+    times, values = history.series("Вітер", [0, 1])
+    assert len(times) == 0 and values.shape == (2, 0)
+    history.append(np.zeros(1_000), np.zeros(1_000), np.ones(1_000), np.datetime64("2024-01-01T00:00:00"))
+    assert history.values.shape == (3, 1_000, 20)
+
+
+def test_ring_keeps_latest_ticks_with_gaps_for_stale_blocks():
+    history = TelemetryHistory(2, capacity=3)
+    for tick in range(5):
+        mask = np.array([True, tick % 2 == 0])
+        history.append(np.full(2, tick), np.full(2, tick), np.full(2, tick),
+                       np.datetime64("2024-01-01T00:00:00") + np.timedelta64(250 * tick, "ms"), mask)
+    times, values = history.series("Температура", [0, 1])
+    assert (np.diff(times.astype(np.int64)) == 250).all()
+    np.testing.assert_array_equal(values[0], [2, 3, 4])
+    np.testing.assert_array_equal(values[1], [2, np.nan, 4])
+
+
+def test_zero_capacity_is_rejected():
+    with pytest.raises(ValueError):
+        TelemetryHistory(10, capacity=0)
@@ -0,0 +1,60 @@
+import gzip
+import io
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from log_export import FORMATS, available_formats, export_csv, iter_csv_chunks
+
+
+@pytest.fixture
+def journal():
+    n = 1234
+    return pd.DataFrame({
+        "Час": pd.date_range("2024-01-01", periods=n, freq="s").astype(str),
+        "Блок": pd.Categorical([f"B{i % 7}" for i in range(n)]),
+        "Статус": ["Норма", "Ожеледь"] * (n // 2),
+        "Вітер": np.round(np.linspace(0, 40, n), 1),
+    })
+
+
+def decompress(data, compression):
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)).read()
+    return data
+
+
+@pytest.mark.parametrize("name", available_formats())
+def test_export_round_trip(journal, name):
+    compression = FORMATS[name][0]
+    data = export_csv(journal, compression, chunk_rows=100)
+    restored = pd.read_csv(io.BytesIO(decompress(data, compression)))
+    pd.testing.assert_frame_equal(restored, journal.astype({"Блок": str}))
+
+
+def test_chunks_match_single_csv(journal):
+    chunks = list(iter_csv_chunks(journal, chunk_rows=500))
+    assert len(chunks) == 3
+    assert b"".join(chunks) == journal.to_csv(index=False).encode("utf-8")
+
+
+def test_empty_journal_keeps_header(journal):
+    data = export_csv(journal.iloc[:0], "gzip")
+    assert gzip.decompress(data).decode("utf-8").strip() == ",".join(journal.columns)
+
+
+def test_unknown_compression_is_rejected(journal):
+    with pytest.raises(ValueError):
+        export_csv(journal, "bz2")
+
+
+def test_zstd_is_hidden_without_zstandard(monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    assert "CSV + zstd" not in available_formats()
+    assert "CSV + gzip" in available_formats()
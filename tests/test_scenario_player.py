@@ -0,0 +1,55 @@
+from streamlit.testing.v1 import AppTest
+
+import scenario_player
+from scenario_player import ScenarioPlayer
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_position_follows_elapsed_time(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(scenario_player.time, "monotonic", clock)
+    player = ScenarioPlayer(interval=1.0)
+    assert not player.finished
+    player.start(["А", "Б", "В"])
+    assert (player.position, player.running, player.finished) == (1, True, False)
+    clock.now += 1.5
+    assert player.position == 2
+    clock.now += 10
+    assert player.position == 3 and player.finished
+    player.reset()
+    assert (player.steps, player.position, player.running) == ([], 0, False)
+
+
+def app():
+    import streamlit as st
+
+    from scenario_player import ScenarioPlayer, play
+
+    if "player" not in st.session_state:
+        st.session_state.player = ScenarioPlayer(interval=1.0)
+    if st.button("▶️"):
+        st.session_state.player.start(["А", "Б"])
+    play(st.session_state.player, done_message="Готово")
+
+
+def test_finished_scenario_is_hidden_after_next_rerun(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(scenario_player.time, "monotonic", clock)
+    at = AppTest.from_function(app)
+    at.run()
+    at.button[0].click()
+    at.run()
+    assert [m.value for m in at.markdown] == ["**Крок 1/2:** А"]
+    clock.now += 5
+    at.run()
+    assert [s.value for s in at.success] == ["Готово"]
+    assert len(at.markdown) == 2
+    at.run()
+    assert len(at.markdown) == 0 and len(at.success) == 0
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from block_store import BlockStore
+from telemetry import SEED_ENV, TelemetryGenerator, seed_from_env
+
+
+def samples(generator, sizes):
+    return [np.stack(generator.sample(n)) for n in sizes]
+
+
+def test_same_seed_replays_bit_for_bit():
+    sizes = [7, 1000, 1, 250]
+    first = samples(TelemetryGenerator(42), sizes)
+    second = samples(TelemetryGenerator(42), sizes)
+    for a, b in zip(first, second):
+        assert a.tobytes() == b.tobytes()
+
+
+def test_reseed_restarts_sequence():
+    generator = TelemetryGenerator(7)
+    first = samples(generator, [10, 20])
+    generator.reseed(7)
+    assert all(np.array_equal(a, b) for a, b in zip(first, samples(generator, [10, 20])))
+    assert not np.array_equal(first[0], samples(TelemetryGenerator(8), [10])[0])
+
+
+def test_values_stay_in_ranges_rounded_to_tenths():
+    generator = TelemetryGenerator(1, humidity=(40, 100), wind=(0, 35))
+    temperature, humidity, wind = generator.sample(10_000)
+    for values, (low, high) in zip((temperature, humidity, wind), generator.ranges.values()):
+        assert values.min() >= low and values.max() <= high
+        np.testing.assert_array_equal(values, np.round(values, 1))
+    assert generator.ranges == {"temperature": (-15.0, 10.0), "humidity": (40.0, 100.0), "wind": (0.0, 35.0)}
+
+
+def test_update_store_replays_and_skips_disabled_blocks():
+    def run():
+        store = BlockStore([f"B{i}" for i in range(100)])
+        store.toggle("B3", False)
+        generator = TelemetryGenerator(5)
+        for _ in range(3):
+            generator.update_store(store)
+        return store
+
+    a, b = run(), run()
+    np.testing.assert_array_equal(a.temperature, b.temperature)
+    np.testing.assert_array_equal(a.status, b.status)
+    assert a["B3"].temperature == 0.0
+
+
+@pytest.mark.parametrize("value, expected", [("", None), ("  ", None), ("17", 17)])
+def test_seed_from_env(monkeypatch, value, expected):
+    monkeypatch.setenv(SEED_ENV, value)
+    assert seed_from_env() == expected
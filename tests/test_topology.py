@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import topology
+from topology import KINDS, Topology
+from topology_generator import generate
+
+
+@pytest.fixture
+def network():
+    generated = generate("ring", substations=4, blocks=20, depth=3, branching=3, seed=5)
+    xy = np.random.default_rng(2).uniform(-1000, 1000, (len(generated), 2))
+    return Topology(generated.ids, generated.kind, generated.edges, xy)
+
+
+def edge_set(network):
+    return {frozenset(pair) for pair in network.edge_names()}
+
+
+def kinds(network):
+    return {node: KINDS[kind] for node, kind in zip(network.ids, network.kind.tolist())}
+
+
+@pytest.mark.parametrize("ext", [".json", ".graphml"])
+def test_round_trip_keeps_everything(network, tmp_path, ext):
+    path = str(tmp_path / f"network{ext}")
+    topology.save(network, path)
+    loaded = topology.load(path)
+    assert loaded.ids == network.ids
+    assert loaded.kind.tolist() == network.kind.tolist()
+    assert loaded.key == network.key
+    np.testing.assert_array_equal(loaded.xy, network.xy)
+    assert loaded.layout() == network.layout()
+
+
+def test_csv_round_trip_keeps_nodes_and_edges(network, tmp_path):
+    # CSV — це список ребер: координат і порядку вузлів у ньому немає
+    path = str(tmp_path / "network.csv")
+    topology.save(network, path)
+    loaded = topology.load(path)
+    assert kinds(loaded) == kinds(network)
+    assert edge_set(loaded) == edge_set(network)
+    assert loaded.xy is None
+
+
+def test_round_trip_without_coordinates(tmp_path):
+    network = generate("radial", substations=2, blocks=5, seed=1)
+    for ext in (".json", ".graphml"):
+        path = str(tmp_path / f"network{ext}")
+        topology.save(network, path)
+        loaded = topology.load(path)
+        assert loaded.key == network.key
+        assert loaded.layout() is None
+
+
+def test_unknown_format_is_rejected(network, tmp_path):
+    with pytest.raises(ValueError):
+        topology.save(network, str(tmp_path / "network.txt"))
+    with pytest.raises(ValueError):
+        topology.load(str(tmp_path / "network.txt"))
@@ -0,0 +1,349 @@
+import functools
+import hashlib
+import json
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from block_store import BlockStore
+
+# -------------------------------
+# Типи вузлів
+# -------------------------------
+KIND_DISPATCHER = "dispatcher"
+KIND_GSM        = "gsm"
+KIND_SUBSTATION = "substation"
+KIND_BLOCK      = "block"
+
+KINDS = (KIND_DISPATCHER, KIND_GSM, KIND_SUBSTATION, KIND_BLOCK)
+DISPATCHER, GSM, SUBSTATION, BLOCK = range(len(KINDS))
+
+# Підписи не-блокових вузлів (на графах і в палітрах)
+KIND_LABELS = {DISPATCHER: "Диспетчер", GSM: "GSM", SUBSTATION: "ПС"}
+
+# Каталог із топологіями за замовчуванням і змінна середовища для власного файлу
+TOPOLOGY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "topologies")
+TOPOLOGY_ENV = "SIMULATOR_TOPOLOGY"
+# Скільки розібраних топологій (файл і його версія) тримає кеш застосунків
+CACHE_ENTRIES = 8
+
+
+def infer_kind(node_id):
+    """Тип вузла за іменем, якщо у файлі його не вказано."""
+    if node_id == "Диспетчер":
+        return KIND_DISPATCHER
+    if node_id.upper().startswith("GSM"):
+        return KIND_GSM
+    if node_id.upper().startswith(("PS", "ПС")):
+        return KIND_SUBSTATION
+    return KIND_BLOCK
+
+
+class Topology:
+    """Незмінна топологія мережі: вузли, їхні типи, ребра і (необов'язково) координати.
+
+    Ідентифікатори інтерновані й пронумеровані; ребра — масив пар індексів.
+    Граф networkx будується одним пакетом у конструкторі; стан блоків для
+    сесії дає block_store(). Об'єкт можна ділити між сесіями (st.cache_resource).
+    """
+
+    def __init__(self, ids, kinds, edges, xy=None, source=None):
+        self.ids = [sys.intern(str(node)) for node in ids]
+        self.index = {node: i for i, node in enumerate(self.ids)}
+        self.kind = np.asarray(kinds, dtype=np.int8)
+        self.edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        self.xy = None if xy is None else np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        self.source = source
+        self._validate()
+        self.block_nodes = np.flatnonzero(self.kind == BLOCK)
+        self.block_ids = [self.ids[i] for i in self.block_nodes]
+        self.roots = [self.ids[i] for i in np.flatnonzero(self.kind == DISPATCHER)]
+        self.graph = nx.Graph()
+        self.graph.add_nodes_from(self.ids)
+        self.graph.add_edges_from(self.edge_names())
+        if len(self.ids) > 1 and not nx.is_connected(self.graph):
+            parts = nx.number_connected_components(self.graph)
+            raise ValueError(f"Топологія незв'язна: {parts} окремих частин")
+        self.key = self._hash()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _validate(self):
+        n = len(self.ids)
+        if not n:
+            raise ValueError("Топологія порожня")
+        if len(self.index) != n:
+            seen = set()
+            duplicates = {node for node in self.ids if node in seen or seen.add(node)}
+            raise ValueError(f"Повторювані вузли: {', '.join(sorted(duplicates)[:10])}")
+        if "" in self.index:
+            raise ValueError("Порожній ідентифікатор вузла")
+        if len(self.kind) != n or ((self.kind < 0) | (self.kind >= len(KINDS))).any():
+            raise ValueError("Невідомий тип вузла")
+        if not (self.kind == BLOCK).any():
+            raise ValueError("У топології немає жодного блока")
+        if self.xy is not None and len(self.xy) != n:
+            raise ValueError("Координати задано не для всіх вузлів")
+        if len(self.edges):
+            if (self.edges < 0).any() or (self.edges >= n).any():
+                raise ValueError("Ребро посилається на невідомий вузол")
+            loops = self.edges[:, 0] == self.edges[:, 1]
+            if loops.any():
+                raise ValueError(f"Петля на вузлі {self.ids[self.edges[loops][0, 0]]}")
+            pairs = np.sort(self.edges, axis=1)
+            unique = np.unique(pairs, axis=0)
+            if len(unique) != len(pairs):
+                raise ValueError(f"Повторюваних ребер: {len(pairs) - len(unique)}")
+
+    def _hash(self):
+        digest = hashlib.sha1()
+        digest.update("\0".join(self.ids).encode("utf-8"))
+        digest.update(self.kind.tobytes())
+        # Ключ не залежить від порядку і напрямку ребер у файлі
+        pairs = np.sort(self.edges, axis=1)
+        digest.update(pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))].tobytes())
+        return digest.hexdigest()
+
+    def edge_names(self):
+        ids = self.ids
+        return [(ids[a], ids[b]) for a, b in self.edges.tolist()]
+
+    def labels(self):
+        """Підпис типу для кожного вузла (для блоків — None, їхній підпис — статус)."""
+        return [KIND_LABELS.get(kind) for kind in self.kind.tolist()]
+
+    def layout(self):
+        """Координати з файлу {вузол: (x, y)} або None, якщо їх немає хоча б для одного вузла."""
+        if self.xy is None or np.isnan(self.xy).any():
+            return None
+        return dict(zip(self.ids, map(tuple, self.xy.tolist())))
+
+    def block_store(self):
+        return BlockStore(self.block_ids)
+
+    def to_json(self):
+        nodes = []
+        for i, node in enumerate(self.ids):
+            item = {"id": node, "kind": KINDS[self.kind[i]]}
+            if self.xy is not None:
+                item["x"], item["y"] = self.xy[i].tolist()
+            nodes.append(item)
+        return {"nodes": nodes, "edges": self.edge_names()}
+
+
+# -------------------------------
+# Побудова з пар імен
+# -------------------------------
+def from_edges(edges, kinds=None, xy=None, nodes=(), source=None):
+    """Топологія зі списку ребер (пар імен); kinds — {вузол: тип}, решту вгадує infer_kind."""
+    kinds = kinds or {}
+    edges = list(edges)
+    frame = pd.DataFrame(edges, columns=["source", "target"]) if edges else None
+    extra = pd.Series(list(nodes), dtype=object)
+    names = extra if frame is None else pd.concat([extra, frame["source"], frame["target"]], ignore_index=True)
+    codes, ids = pd.factorize(names.astype(str))
+    ids = ids.tolist()
+    pairs = codes[len(extra):].reshape(2, -1).T if frame is not None else np.empty((0, 2), dtype=np.int64)
+    kind = [KINDS.index(kinds.get(node) or infer_kind(node)) for node in ids]
+    coords = None
+    if xy:
+        coords = [xy.get(node, (np.nan, np.nan)) for node in ids]
+    return Topology(ids, kind, pairs, coords, source)
+
+
+# -------------------------------
+# Формати файлів
+# -------------------------------
+def load_json(path):
+    """{"nodes": [{"id", "kind", "x", "y"} або "id", ...], "edges": [[from, to], ...]}"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    ids, kinds, xy = [], [], []
+    for item in data.get("nodes", []):
+        if isinstance(item, dict):
+            node = str(item["id"])
+            kind = item.get("kind") or infer_kind(node)
+            xy.append((item.get("x", np.nan), item.get("y", np.nan)))
+        else:
+            node = str(item)
+            kind = infer_kind(node)
+            xy.append((np.nan, np.nan))
+        if kind not in KINDS:
+            raise ValueError(f"Невідомий тип вузла {node}: {kind}")
+        ids.append(node)
+        kinds.append(KINDS.index(kind))
+    index = {node: i for i, node in enumerate(ids)}
+    try:
+        edges = [(index[str(a)], index[str(b)]) for a, b in data.get("edges", [])]
+    except KeyError as missing:
+        raise ValueError(f"Ребро посилається на невідомий вузол {missing.args[0]}") from None
+    coords = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+    return Topology(ids, kinds, edges, None if np.isnan(coords).all() else coords, path)
+
+
+def load_csv(path):
+    """Список ребер: колонки source,target (або перші дві) і необов'язкові source_kind,target_kind."""
+    frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+    if {"source", "target"} - set(frame.columns):
+        frame = frame.rename(columns=dict(zip(frame.columns[:2], ("source", "target"))))
+    kinds = {}
+    for side in ("source", "target"):
+        column = f"{side}_kind"
+        if column in frame:
+            kinds.update(zip(frame[side], frame[column]))
+    unknown = set(kinds.values()) - set(KINDS) - {""}
+    if unknown:
+        raise ValueError(f"Невідомий тип вузла: {', '.join(sorted(unknown))}")
+    return from_edges(list(zip(frame["source"], frame["target"])), kinds, source=path)
+
+
+def load_graphml(path):
+    """GraphML з атрибутами вузлів kind, x, y (потоковий розбір, без nx.read_graphml)."""
+    ns = "{http://graphml.graphdrawing.org/xmlns}"
+    keys = {}
+    ids, kinds, xy, edges = [], [], [], []
+    for _, element in ET.iterparse(path):
+        tag = element.tag.replace(ns, "")
+        if tag == "key":
+            keys[element.get("id")] = element.get("attr.name")
+        elif tag == "node":
+            attrs = {keys.get(data.get("key"), data.get("key")): data.text for data in element.iter(ns + "data")}
+            node = element.get("id")
+            ids.append(node)
+            kind = attrs.get("kind") or infer_kind(node)
+            if kind not in KINDS:
+                raise ValueError(f"Невідомий тип вузла {node}: {kind}")
+            kinds.append(KINDS.index(kind))
+            xy.append((float(attrs.get("x", "nan")), float(attrs.get("y", "nan"))))
+            element.clear()
+        elif tag == "edge":
+            edges.append((element.get("source"), element.get("target")))
+            element.clear()
+    index = {node: i for i, node in enumerate(ids)}
+    try:
+        pairs = [(index[a], index[b]) for a, b in edges]
+    except KeyError as missing:
+        raise ValueError(f"Ребро посилається на невідомий вузол {missing.args[0]}") from None
+    coords = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+    return Topology(ids, kinds, pairs, None if np.isnan(coords).all() else coords, path)
+
+
+LOADERS = {".json": load_json, ".csv": load_csv, ".graphml": load_graphml}
+
+
+def resolve(path):
+    """Шлях як є, або ім'я файлу з каталогу topologies/."""
+    if os.path.exists(path) or os.path.isabs(path):
+        return path
+    return os.path.join(TOPOLOGY_DIR, path)
+
+
+def load(path):
+    path = resolve(path)
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in LOADERS:
+        raise ValueError(f"Невідомий формат топології: {ext}")
+    return LOADERS[ext](path)
+
+
+# -------------------------------
+# Запис (ті самі формати, що читає load)
+# -------------------------------
+def save_json(network, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(network.to_json(), f, ensure_ascii=False, separators=(",", ":"))
+
+
+def save_csv(network, path):
+    kinds = np.asarray(KINDS, dtype=object)[network.kind]
+    ids = np.asarray(network.ids, dtype=object)
+    a, b = network.edges[:, 0], network.edges[:, 1]
+    pd.DataFrame({
+        "source": ids[a], "target": ids[b], "source_kind": kinds[a], "target_kind": kinds[b],
+    }).to_csv(path, index=False, encoding="utf-8")
+
+
+def save_graphml(network, path):
+    root = ET.Element("graphml", xmlns="http://graphml.graphdrawing.org/xmlns")
+    ET.SubElement(root, "key", {"id": "kind", "for": "node", "attr.name": "kind", "attr.type": "string"})
+    if network.xy is not None:
+        for axis in ("x", "y"):
+            ET.SubElement(root, "key", {"id": axis, "for": "node", "attr.name": axis, "attr.type": "double"})
+    graph = ET.SubElement(root, "graph", edgedefault="undirected")
+    for i, node in enumerate(network.ids):
+        element = ET.SubElement(graph, "node", id=node)
+        ET.SubElement(element, "data", key="kind").text = KINDS[network.kind[i]]
+        if network.xy is not None:
+            ET.SubElement(element, "data", key="x").text = repr(float(network.xy[i, 0]))
+            ET.SubElement(element, "data", key="y").text = repr(float(network.xy[i, 1]))
+    for source, target in network.edge_names():
+        ET.SubElement(graph, "edge", source=source, target=target)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+SAVERS = {".json": save_json, ".csv": save_csv, ".graphml": save_graphml}
+
+
+def save(network, path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SAVERS:
+        raise ValueError(f"Невідомий формат топології: {ext}")
+    SAVERS[ext](network, path)
+
+
+# -------------------------------
+# Вибір топології в застосунках Streamlit
+# -------------------------------
+def available():
+    """Імена файлів топологій із каталогу topologies/ у форматах, які читає load."""
+    try:
+        names = os.listdir(TOPOLOGY_DIR)
+    except OSError:
+        return []
+    return sorted(name for name in names if os.path.splitext(name)[1].lower() in LOADERS)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_load():
+    # Streamlit потрібен лише застосункам: simulator і topology_generator обходяться без нього
+    import streamlit as st
+
+    @st.cache_resource(max_entries=CACHE_ENTRIES)
+    def load_cached(path, mtime):
+        # Файл розбирається один раз для всіх сесій; mtime у ключі — перечитати після зміни
+        return load(path)
+
+    return load_cached
+
+
+def select(default):
+    """Топологія застосунку: файл із topologies/, обраний у бічній панелі.
+
+    Клієнт обирає лише з каталогу; довільний шлях задається тільки на
+    сервері змінною TOPOLOGY_ENV. Якщо файл не читається — помилка й st.stop().
+    """
+    import streamlit as st
+
+    override = os.environ.get(TOPOLOGY_ENV)
+    if override:
+        path = resolve(override)
+        st.sidebar.caption(f"🗺 Топологія: {os.path.basename(path)} (задано в {TOPOLOGY_ENV})")
+    else:
+        names = available()
+        if not names:
+            st.error(f"У каталозі {TOPOLOGY_DIR} немає файлів топологій")
+            st.stop()
+        name = st.sidebar.selectbox(
+            "🗺 Файл топології", names, index=names.index(default) if default in names else 0
+        )
+        path = os.path.join(TOPOLOGY_DIR, name)
+    try:
+        return _cached_load()(path, os.path.getmtime(path))
+    except (OSError, ValueError) as error:
+        st.error(f"Не вдалося завантажити топологію {path}: {error}")
+        st.stop()
@@ -0,0 +1,126 @@
+"""Синтетичні топології мережі для бенчмарків і тестів навантаження.
+
+    python -m topology_generator --shape radial --substations 100 --blocks 1000 --seed 1 --out radial.json
+    python -m topology_generator --shape ring --substations 20 --blocks 50 --out ring.csv
+    python -m topology_generator --gateways 8 --substations 200 --blocks 500 --out multi_gsm.graphml
+
+Результат — той самий формат, що читає topology.load (графи, диспетчер, simulator run --topology).
+"""
+import argparse
+import time
+
+import numpy as np
+
+import topology
+from topology import BLOCK, DISPATCHER, GSM, SUBSTATION, Topology
+
+SHAPES = ("radial", "ring")
+
+
+def feeder_capacity(depth, branching):
+    """Скільки блоків уміщує фідер глибини depth з розгалуженням branching."""
+    return sum(branching ** level for level in range(1, depth + 1))
+
+
+def _feeder(rng, n_blocks, depth, branching):
+    """Випадкове дерево фідера: батько кожного блока (-1 — підстанція) і глибина.
+
+    Новий блок чіпляється до випадкового вузла, у якого ще є вільне
+    відгалуження і який не на граничній глибині.
+    """
+    parent = np.empty(n_blocks, dtype=np.int64)
+    level = np.empty(n_blocks, dtype=np.int64)
+    children = np.zeros(n_blocks + 1, dtype=np.int64)
+    # Відкриті для приєднання вузли; індекс n_blocks — сама підстанція
+    open_nodes = [n_blocks]
+    open_depth = {n_blocks: 0}
+    for block in range(n_blocks):
+        slot = int(rng.integers(len(open_nodes)))
+        host = open_nodes[slot]
+        parent[block] = -1 if host == n_blocks else host
+        level[block] = open_depth[host] + 1
+        children[host] += 1
+        if children[host] >= branching:
+            open_nodes[slot] = open_nodes[-1]
+            open_nodes.pop()
+        if level[block] < depth:
+            open_nodes.append(block)
+            open_depth[block] = level[block]
+    return parent, level
+
+
+def generate(shape="radial", substations=10, blocks=100, depth=4, branching=3, gateways=1, seed=None):
+    """Мережа: Диспетчер → GSM-шлюзи → substations підстанцій → по blocks блоків на кожній.
+
+    shape="radial" — розімкнені радіальні фідери; "ring" — підстанції з'єднані
+    в кільце, а найглибший блок кожного фідера має перемичку до наступного.
+    Підстанції розподіляються між gateways шлюзами по черзі.
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Невідома форма мережі: {shape}")
+    if min(substations, blocks, depth, branching, gateways) < 1:
+        raise ValueError("Усі розміри мережі мають бути додатними")
+    if blocks > feeder_capacity(depth, branching):
+        raise ValueError(
+            f"{blocks} блоків не вміщаються у фідер глибини {depth} з розгалуженням {branching} "
+            f"(максимум {feeder_capacity(depth, branching)})"
+        )
+    rng = np.random.default_rng(seed)
+    ids = ["Диспетчер"]
+    kinds = [DISPATCHER]
+    edges = []
+    gateway_ids = ["GSM"] if gateways == 1 else [f"GSM{g}" for g in range(1, gateways + 1)]
+    for name in gateway_ids:
+        edges.append((0, len(ids)))
+        ids.append(name)
+        kinds.append(GSM)
+    substation_idx = []
+    tails = []
+    for s in range(substations):
+        ps = len(ids)
+        substation_idx.append(ps)
+        edges.append((1 + s % gateways, ps))
+        ids.append(f"PS{s + 1}")
+        kinds.append(SUBSTATION)
+        first = len(ids)
+        parent, level = _feeder(rng, blocks, depth, branching)
+        ids.extend(f"TP{s + 1}.{b + 1}" for b in range(blocks))
+        kinds.extend([BLOCK] * blocks)
+        edges.extend(zip(np.where(parent < 0, ps, first + parent).tolist(), range(first, first + blocks)))
+        tails.append(first + int(np.argmax(level)))
+    if shape == "ring" and substations > 1:
+        ring = list(zip(substation_idx, substation_idx[1:] + substation_idx[:1]))
+        ties = list(zip(tails, tails[1:] + tails[:1]))
+        if substations == 2:
+            ring, ties = ring[:1], ties[:1]
+        edges.extend(ring)
+        edges.extend(ties)
+    return Topology(ids, kinds, edges, source=f"generated:{shape}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m topology_generator", description="Генератор синтетичних топологій мережі")
+    parser.add_argument("--shape", choices=SHAPES, default="radial")
+    parser.add_argument("--substations", type=int, default=10, help="кількість підстанцій")
+    parser.add_argument("--blocks", type=int, default=100, help="блоків на підстанцію")
+    parser.add_argument("--depth", type=int, default=4, help="максимальна глибина фідера")
+    parser.add_argument("--branching", type=int, default=3, help="максимум відгалужень від вузла")
+    parser.add_argument("--gateways", type=int, default=1, help="кількість GSM-шлюзів")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", required=True, help="файл .json, .csv або .graphml")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        network = generate(args.shape, args.substations, args.blocks, args.depth, args.branching, args.gateways, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    topology.save(network, args.out)
+    print(
+        f"{args.out}: {len(network)} вузлів, {len(network.edges)} ребер, {len(network.block_ids)} блоків "
+        f"за {time.perf_counter() - started:.2f} с"
+    )
+
+
+if __name__ == "__main__":
+    main()